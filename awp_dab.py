@@ -20,26 +20,87 @@ os.environ['NO_AT_BRIDGE'] = '1'  # Suppress GTK accessibility warnings
 
 import sys
 import shutil
-import configparser
+import tempfile
+import functools
+import io
+import re
+import copy
+import stat
+from contextlib import contextmanager
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QFileDialog, QComboBox, QMessageBox, QTabWidget,
     QCheckBox
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPixmap
-from PIL import Image
+from PyQt5.QtCore import (
+    Qt, QTimer, QObject, QRunnable, QThread, QThreadPool, QFileSystemWatcher, QSignalBlocker,
+    pyqtSignal
+)
+from PyQt5.QtGui import QImage, QPixmap, QPixmapCache, QStandardItemModel, QStandardItem
 
 # =============================================================================
 # PATHS AND CONSTANTS
 # =============================================================================
-AWP_DIR = os.path.expanduser("~/awp")
+USER_HOME = os.path.expanduser("~")  # Resolved once; other paths join onto it
+AWP_DIR = os.path.join(USER_HOME, "awp")
 CONFIG_PATH = os.path.join(AWP_DIR, "awp_config.ini")
 ICON_DIR = os.path.join(AWP_DIR, "logos")
-BASE_FOLDER = os.path.expanduser("~")
-USER_HOME = BASE_FOLDER
+BASE_FOLDER = USER_HOME
 DEFAULT_ICON = os.path.join(AWP_DIR, "debian.png")
 
+# Static choices offered on the General Settings tab
+DE_ITEMS = ("xfce", "gnome", "cinnamon", "mate", "generic", "unknown")
+SESSION_ITEMS = ("x11", "wayland")
+BLANKING_ITEMS = (
+    ("Disabled", "0"),
+    ("30 seconds", "30"),
+    ("1 minute", "60"),
+    ("5 minutes", "300"),
+    ("10 minutes", "600"),
+    ("20 minutes", "1200"),
+    ("30 minutes", "1800"),
+    ("1 hour", "3600"),
+)
+BLANKING_INDEX = {data: i for i, (_, data) in enumerate(BLANKING_ITEMS)}
+WS_COUNT_ITEMS = tuple(str(i) for i in range(1, 9))
+
+# Values assumed for settings missing from the config
+_GENERAL_DEFAULTS = {
+    'os_detected': '',
+    'session_type': '',
+    'blanking_timeout': '0',
+    'blanking_pause': 'false',
+    'workspaces': '3',
+}
+_WORKSPACE_DEFAULTS = {
+    'folder': '',
+    'icon': '',
+    'timing': '5m',
+    'mode': 'random',
+    'order': 'name_az',
+    'scaling': 'scaled',
+}
+
+# Theme subdirectories that mark window manager/desktop components
+_WM_SUBDIRS = frozenset(('cinnamon', 'metacity-1', 'xfwm4', 'gnome-shell', 'openbox-3'))
+
+# Base directories searched for icon/cursor themes and GTK/WM themes
+_ICON_PATHS = (
+    '/usr/share/icons',
+    '/usr/local/share/icons',
+    os.path.join(USER_HOME, '.icons'),
+    os.path.join(USER_HOME, '.local/share/icons')
+)
+_THEME_PATHS = (
+    '/usr/share/themes',
+    '/usr/local/share/themes',
+    os.path.join(USER_HOME, '.themes'),
+    os.path.join(USER_HOME, '.local/share/themes')
+)
+
+# Every base directory watched for theme installs and removals
+_THEME_BASES = frozenset(_ICON_PATHS + _THEME_PATHS)
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -47,28 +108,53 @@ DEFAULT_ICON = os.path.join(AWP_DIR, "debian.png")
 def get_icon_color(image_path):
     """
     Extract dominant color from an image file.
-    
+
+    Results are cached per (path, mtime, size), so an unchanged icon is
+    only decoded once while an edited or replaced file is picked up again.
+
     Args:
         image_path (str): Path to the image file
-        
+
     Returns:
         str: Hex color code of the first non-transparent pixel, or empty string on error
     """
     try:
-        with Image.open(image_path) as img:
-            rgba = img.convert("RGBA")
-            pixels = list(rgba.getdata())
-            for r, g, b, a in pixels:
-                if a > 0:
-                    return f'#{r:02x}{g:02x}{b:02x}'
-            return ""
-    except Exception:
+        st = os.stat(image_path)
+    except OSError:
         return ""
+    return _icon_color_cached(image_path, st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=256)
+def _icon_color_cached(image_path, mtime_ns, size):
+    """Decode an icon and compute its color; see get_icon_color()."""
+    img = QImage(image_path)
+    if img.isNull():
+        return ""
+    # Same definition as awp_setup.get_icon_color(): the first pixel, in
+    # row-major order, that is not fully transparent. RGBA8888 stores
+    # unpremultiplied R, G, B, A bytes with no row padding
+    img = img.convertToFormat(QImage.Format_RGBA8888)
+    ptr = img.constBits()
+    ptr.setsize(img.bytesPerLine() * img.height())
+    data = bytes(ptr)
+    alpha = data[3::4]
+    first = len(alpha) - len(alpha.lstrip(b"\x00"))
+    if first == len(alpha):
+        return ""
+    r, g, b = data[4 * first:4 * first + 3]
+    return f'#{r:02x}{g:02x}{b:02x}'
+
+# Last theme scan, keyed by the mtimes of the base directories it walked
+_themes_cache = {'key': None, 'val': None}
 
 def get_available_themes():
     """
     Discover available themes on the system and return categorized lists.
     
+    The result is reused for as long as none of the theme/icon base
+    directories has gained or lost an entry (their mtimes are unchanged);
+    call _invalidate_theme_cache() to force a rescan.
+    
     Returns:
         dict: Categorized theme lists including:
             - icon_themes: Available icon themes
@@ -77,6 +163,38 @@ def get_available_themes():
             - desktop_themes: Themes with Cinnamon desktop support
             - wm_themes: Themes with window manager components
     """
+    # One stat per base directory both validates the cache and tells the
+    # scan which bases exist
+    mtimes = {}
+    for path in _ICON_PATHS + _THEME_PATHS:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if stat.S_ISDIR(st.st_mode):
+            mtimes[path] = st.st_mtime_ns
+    key = tuple(mtimes.items())
+    if key == _themes_cache['key']:
+        return _themes_cache['val']
+
+    icon_bases = [path for path in _ICON_PATHS if path in mtimes]
+    theme_bases = [path for path in _THEME_PATHS if path in mtimes]
+    themes = _scan_themes(icon_bases, theme_bases)
+    _themes_cache['key'] = key
+    _themes_cache['val'] = themes
+    return themes
+
+def _scan_themes(icon_bases, theme_bases):
+    """
+    Walk the given base directories; see get_available_themes().
+    
+    Args:
+        icon_bases (list): Existing icon/cursor theme base directories
+        theme_bases (list): Existing GTK/WM theme base directories
+        
+    Returns:
+        dict: Categorized theme lists
+    """
     themes = {
         'icon_themes': [],
         'gtk_themes': [], 
@@ -85,90 +203,326 @@ def get_available_themes():
         'wm_themes': []        # For window borders specifically
     }
     
-    # Discover icon themes
-    icon_paths = [
-        '/usr/share/icons', 
-        os.path.expanduser('/usr/local/share/icons'),
-        os.path.expanduser('~/.icons'),
-        os.path.expanduser('~/.local/share/icons')
-    ]
+    # Discover icon themes, and cursor themes in the same walk
+    icon_themes = set()
+    cursor_themes = set()
+    for path in icon_bases:
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    icon_themes.add(entry.name)
+                    if os.path.isdir(os.path.join(entry.path, 'cursors')):
+                        cursor_themes.add(entry.name)
+        except (PermissionError, OSError):
+            pass  # Skip directories we can't read
     
-    for path in icon_paths:
-        if os.path.exists(path):
+    # Discover ALL themes
+    # Walk every theme directory once, recording which components it ships
+    theme_info = {}  # theme name -> {'wm': bool, 'cinnamon': bool}
+    for path in theme_bases:
+        try:
+            with os.scandir(path) as it:
+                theme_dirs = [e for e in it if e.is_dir()]
+        except (PermissionError, OSError):
+            continue  # Skip directories we can't read
+        for entry in theme_dirs:
             try:
-                items = [d for d in os.listdir(path) 
-                        if os.path.isdir(os.path.join(path, d))]
-                themes['icon_themes'].extend(items)
-            except (PermissionError, OSError):
-                pass  # Skip directories we can't read
+                with os.scandir(entry.path) as it:
+                    subs = {e.name for e in it}
+            except OSError:
+                subs = set()
+            info = theme_info.setdefault(entry.name, {'wm': False, 'cinnamon': False})
+            info['wm'] = info['wm'] or not subs.isdisjoint(_WM_SUBDIRS)
+            info['cinnamon'] = info['cinnamon'] or 'cinnamon' in subs
     
-    # Discover ALL themes
-    theme_paths = [
-        '/usr/share/themes',
-        '/usr/local/share/themes', 
-        os.path.expanduser('~/.themes'),
-        os.path.expanduser('~/.local/share/themes')
-    ]
+    # Themes with window manager components; those with Cinnamon support are desktop themes
+    wm_themes = [t for t, info in theme_info.items() if info['wm']]
+    desktop_themes = [t for t, info in theme_info.items() if info['cinnamon']]
     
-    all_themes = []
-    for path in theme_paths:
-        if os.path.exists(path):
-            try:
-                items = [d for d in os.listdir(path) 
-                        if os.path.isdir(os.path.join(path, d))]
-                all_themes.extend(items)
-            except (PermissionError, OSError):
-                pass  # Skip directories we can't read
+    # Sort all lists alphabetically (theme_info keys are already unique)
+    themes['gtk_themes'] = sorted(theme_info)
+    themes['desktop_themes'] = sorted(desktop_themes)
+    themes['wm_themes'] = sorted(wm_themes)
+    themes['icon_themes'] = sorted(icon_themes)
+    themes['cursor_themes'] = sorted(cursor_themes)
     
-    # Filter for themes that have Cinnamon support (desktop themes)
-    desktop_themes = []
-    wm_themes = []
+    return themes
+
+def _invalidate_theme_cache():
+    """Drop the cached theme scan so the next lookup rereads the disk."""
+    _themes_cache['key'] = None
+
+def set_combo_items(combo, items):
+    """
+    Replace the contents of a combo box in a single model swap.
     
-    for theme in all_themes:
-        # Check all possible theme paths
-        theme_paths_to_check = []
-        for base_path in theme_paths:
-            if os.path.exists(base_path):
-                # Check for various window manager/desktop components
-                possible_paths = [
-                    os.path.join(base_path, theme, 'cinnamon'),
-                    os.path.join(base_path, theme, 'metacity-1'), 
-                    os.path.join(base_path, theme, 'xfwm4'),
-                    os.path.join(base_path, theme, 'gnome-shell'),
-                    os.path.join(base_path, theme, 'openbox-3')
-                ]
-                theme_paths_to_check.extend(possible_paths)
-        
-        # Check if this theme has window manager components
-        has_wm = any(os.path.exists(path) for path in theme_paths_to_check)
+    Builds the whole model up front instead of one addItem per entry, and
+    attaches a data-to-index map used by select_combo_data().
+    
+    Args:
+        combo (QComboBox): Combo box to populate
+        items (list): (text, data) pairs; data of None stores no item data
+    """
+    model = QStandardItemModel(combo)
+    column = []
+    for text, data in items:
+        item = QStandardItem(text)
+        if data is not None:
+            item.setData(data, Qt.UserRole)
+        column.append(item)
+    if column:
+        model.appendColumn(column)
+    combo.blockSignals(True)
+    combo.setModel(model)
+    combo.blockSignals(False)
+    # Reverse map so values can be selected without scanning the items
+    combo._data_index = {data: i for i, (_, data) in enumerate(items)
+                         if data is not None}
+
+def _stat_file(path):
+    """
+    Stat a path once for both the regular-file test and its metadata.
+    
+    Args:
+        path (str): Path to check
         
-        if has_wm:
-            wm_themes.append(theme)
-            # Themes with Cinnamon specific support are desktop themes
-            if any('cinnamon' in path for path in theme_paths_to_check if os.path.exists(path)):
-                desktop_themes.append(theme)
+    Returns:
+        os.stat_result: Stat of the regular file, or None if it is missing or not a file
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+def write_config_atomic(data, path):
+    """
+    Replace a config file atomically, keeping the previous version as .bak.
     
-    # Sort all lists alphabetically
-    themes['gtk_themes'] = sorted(list(set(all_themes)))
-    themes['desktop_themes'] = sorted(list(set(desktop_themes)))
-    themes['wm_themes'] = sorted(list(set(wm_themes)))
-    themes['icon_themes'] = sorted(list(set(themes['icon_themes'])))
+    The new contents are staged in a temp file in the same directory and
+    renamed over the target, so readers such as the daemon never see a
+    missing or half-written config. The backup is a hard link to the old
+    file when the filesystem allows it, which avoids copying its bytes.
     
-    # Discover cursor themes
-    cursor_themes = []
-    for path in icon_paths:
-        if os.path.exists(path):
+    Args:
+        data (bytes): Serialized configuration to write
+        path (str): Destination config file
+    """
+    # Replace the file a symlinked config points at, not the link itself;
+    # the backup stays next to the path callers know
+    backup_path = path + ".bak"
+    path = os.path.realpath(path)
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".awp_config.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            # Make the new contents durable before they replace the old file
+            f.flush()
+            os.fsync(f.fileno())
+        st = _stat_file(path)
+        if st is not None:
+            os.chmod(tmp_path, stat.S_IMODE(st.st_mode))
             try:
-                for theme in os.listdir(path):
-                    cursor_path = os.path.join(path, theme, 'cursors')
-                    if os.path.exists(cursor_path):
-                        cursor_themes.append(theme)
-            except (PermissionError, OSError):
-                pass
+                if os.path.lexists(backup_path):
+                    os.unlink(backup_path)
+                os.link(path, backup_path)
+            except OSError:
+                shutil.copyfile(path, backup_path)
+        else:
+            # mkstemp creates 0600; give a new config the umask-default
+            # mode open(..., 'w') would have
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+def _icon_up_to_date(src, dest):
+    """
+    Check whether dest already holds a copy of src.
     
-    themes['cursor_themes'] = sorted(list(set(cursor_themes)))
+    Args:
+        src (str): Icon chosen by the user
+        dest (str): Installed copy in the logos folder
+        
+    Returns:
+        bool: True if dest is src itself, or has the same size and mtime
+              (save_config stamps each copy with the source mtime)
+    """
+    try:
+        if os.path.samefile(src, dest):
+            return True
+        src_st = os.stat(src)
+        dest_st = os.stat(dest)
+    except OSError:
+        return False
+    return (src_st.st_size == dest_st.st_size
+            and src_st.st_mtime_ns == dest_st.st_mtime_ns)
+
+def select_combo_data(combo, value):
+    """
+    Select the combo item whose data equals value.
     
-    return themes
+    Uses the data-to-index map attached when the combo was built.
+    
+    Args:
+        combo (QComboBox): Combo box populated by set_combo_items
+        value (str): Item data to select
+        
+    Returns:
+        bool: True if a matching item was selected
+    """
+    idx = combo._data_index.get(value)
+    if idx is None:
+        return False
+    combo.setCurrentIndex(idx)
+    return True
+
+# =============================================================================
+# CONFIGURATION PARSING
+# =============================================================================
+
+class FastConfigParser:
+    """
+    Minimal INI reader/writer backed by plain dictionaries.
+    
+    Covers the subset of ConfigParser the dashboard uses: sections map to
+    dicts of lowercased keys, values are stored verbatim (no interpolation),
+    and write() emits the same "key = value" layout ConfigParser produces so
+    the daemon and setup script keep reading the file unchanged.
+    """
+    
+    _SECTION_RE = re.compile(r'^\[(.+?)\]\s*$')
+    _OPTION_RE = re.compile(r'^([^=]+?)\s*=\s*(.*)$')
+
+    def __init__(self):
+        self._sections = {}
+
+    def read(self, path):
+        """
+        Parse an INI file, merging its sections into this parser.
+        
+        Args:
+            path (str): Path to the INI file
+            
+        Returns:
+            list: [path] if the file was read, otherwise an empty list
+        """
+        try:
+            with open(path, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return []
+
+        section = None
+        for line in lines:
+            stripped = line.strip()
+            if not stripped or stripped[0] in '#;':
+                continue
+            match = self._SECTION_RE.match(stripped)
+            if match:
+                section = self._sections.setdefault(match.group(1), {})
+                continue
+            match = self._OPTION_RE.match(stripped)
+            if match and section is not None:
+                section[match.group(1).strip().lower()] = match.group(2)
+        return [path]
+
+    def has_section(self, name):
+        """Return True if the section exists."""
+        return name in self._sections
+
+    def add_section(self, name):
+        """Create an empty section named name."""
+        self._sections.setdefault(name, {})
+
+    def get(self, section, key, default=None):
+        """
+        Look up a single value.
+        
+        Args:
+            section (str): Section name
+            key (str): Option name
+            default: Value returned when the section or option is missing
+            
+        Returns:
+            str: Stored value or default
+        """
+        return self._sections.get(section, {}).get(key.lower(), default)
+
+    def sections(self):
+        """Return the list of section names in file order."""
+        return list(self._sections)
+
+    def __contains__(self, name):
+        return name in self._sections
+
+    def __getitem__(self, name):
+        return self._sections[name]
+
+    def __setitem__(self, name, values):
+        self._sections[name] = {key.lower(): str(value) for key, value in values.items()}
+
+    def write(self, fp):
+        """
+        Serialize all sections to an open text file.
+        
+        Args:
+            fp (file): Writable text file object
+        """
+        parts = []
+        for name, values in self._sections.items():
+            parts.append(f"[{name}]\n")
+            parts.extend(f"{key} = {value}\n" for key, value in values.items())
+            parts.append("\n")
+        fp.write("".join(parts))
+
+# =============================================================================
+# BACKGROUND WORKERS
+# =============================================================================
+
+class ThemeScanSignals(QObject):
+    """Signals emitted by ThemeScanner (QRunnable cannot define its own)."""
+    finished = pyqtSignal(dict)
+
+class ThemeScanner(QRunnable):
+    """
+    Run get_available_themes() on a thread pool worker.
+    
+    The result is delivered through signals.finished, which Qt queues back
+    to the GUI thread so slots may touch widgets directly.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = ThemeScanSignals()
+
+    def run(self):
+        self.signals.finished.emit(get_available_themes())
+
+class ConfigLoader(QThread):
+    """
+    Parse the config file off the GUI thread.
+    
+    loaded is emitted from the worker thread; the auto connection to a slot
+    on a GUI object is queued, so the slot runs on the GUI thread.
+    """
+    loaded = pyqtSignal(object)
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+
+    def run(self):
+        config = FastConfigParser()
+        config.read(self.path)
+        self.loaded.emit(config)
 
 # =============================================================================
 # WORKSPACE CONFIGURATION TAB
@@ -184,23 +538,43 @@ class WorkspaceTab(QWidget):
     - Theme customization per workspace
     - Real-time icon preview
     
+    The child widgets are only created when the tab is first shown; until
+    then configuration loaded into the tab is kept as a plain dict.
+    
     Attributes:
         index (int): Workspace number (1-based)
         parent_window (AWPDashboard): Reference to main dashboard window
+        available_themes (dict): Theme scan shared by all tabs, or None while scanning
     """
     
-    def __init__(self, index, parent_window):
+    def __init__(self, index, parent_window, available_themes=None):
         """
         Initialize workspace configuration tab.
         
         Args:
             index (int): Workspace number (1-based)
             parent_window (AWPDashboard): Parent dashboard instance
+            available_themes (dict): Result of get_available_themes(), if known yet
         """
         super().__init__()
         self.index = index
         self.parent_window = parent_window
+        self.available_themes = available_themes
+        self.is_built = False
+        self._pending_section = None
 
+    def ensure_built(self):
+        """Create the tab's widgets on first use and apply any pending config."""
+        if self.is_built:
+            return
+        self.is_built = True
+        self.build_ui()
+        if self._pending_section is not None:
+            section, self._pending_section = self._pending_section, None
+            self.load_from_config(section)
+
+    def build_ui(self):
+        """Create and arrange the tab's widgets."""
         layout = QVBoxLayout()
         layout.setSpacing(10)
 
@@ -212,8 +586,7 @@ class WorkspaceTab(QWidget):
             combo.setMaximumWidth(250)
             combo.setEditable(True)
             combo.setInsertPolicy(QComboBox.NoInsert)
-            for text, data in items:
-                combo.addItem(text, data)
+            set_combo_items(combo, items)
             return combo
 
         # === WALLPAPER SETTINGS SECTION ===
@@ -251,7 +624,14 @@ class WorkspaceTab(QWidget):
         self.icon_edit.setMaximumWidth(300)
         self.icon_edit.setPlaceholderText("Path to icon file...")
         self.icon_edit.setToolTip("Path to custom icon image (PNG, JPG, SVG)")
-        self.icon_edit.textChanged.connect(self.update_icon_preview)
+        # Refresh the preview once typing pauses rather than on every keystroke
+        self._icon_debounce = QTimer(self)
+        self._icon_debounce.setSingleShot(True)
+        self._icon_debounce.setInterval(150)
+        # While typing a cheap preview is enough; smooth it once editing ends
+        self._icon_debounce.timeout.connect(lambda: self.update_icon_preview(smooth=False))
+        self.icon_edit.textChanged.connect(lambda _text: self._icon_debounce.start())
+        self.icon_edit.editingFinished.connect(self.update_icon_preview)
         row.addWidget(self.icon_edit)
         self.icon_btn = QPushButton("Browse")
         self.icon_btn.setFixedWidth(80)
@@ -262,6 +642,9 @@ class WorkspaceTab(QWidget):
         layout.addLayout(row)
 
         # --- Floating Icon Preview ---
+        self._last_icon_key = None
+        self._last_icon_smooth = False
+        self._preview_dirty = True
         self.icon_preview = QLabel(self)
         self.icon_preview.setFixedSize(64, 64)
         self.icon_preview.setToolTip("Live preview of selected workspace icon")
@@ -333,7 +716,7 @@ class WorkspaceTab(QWidget):
             ("Window Theme", "wm_theme", "wm_themes", "Window borders and controls")
         ]
         
-        available_themes = get_available_themes()
+        self.theme_types = {}
         for label, key, theme_type, tooltip in theme_settings:
             row = QHBoxLayout()
             row.setSpacing(5)
@@ -341,25 +724,62 @@ class WorkspaceTab(QWidget):
             lbl.setFixedWidth(120)
             lbl.setToolTip(tooltip)
             row.addWidget(lbl)
+            # Themes are filled in by populate_themes() once the scan is done
             combo = create_theme_like_combo([("(Not set)", "")])
             combo.setToolTip(f"Select {label.lower()} for this workspace")
-            for theme in available_themes.get(theme_type, []):
-                combo.addItem(theme)
             row.addWidget(combo)
             row.addStretch(1)
             self.theme_controls[key] = combo
+            self.theme_types[key] = theme_type
             layout.addLayout(row)
 
+        if self.available_themes is not None:
+            self.populate_themes(self.available_themes)
+        else:
+            for combo in self.theme_controls.values():
+                combo.addItem("(scanning\u2026)")
+                combo.model().item(1).setEnabled(False)
+
         # Initialize theme availability based on current DE
+        self._last_de = None
         self.update_theme_availability()
         
         layout.addStretch()
         self.setLayout(layout)
         self.update_icon_preview()
 
+    def populate_themes(self, available_themes):
+        """
+        Fill the theme combos with discovered themes.
+        
+        Keeps whatever value each combo currently shows, so settings loaded
+        from the config before the scan finished are not lost.
+        
+        Args:
+            available_themes (dict): Result of get_available_themes()
+        """
+        self.available_themes = available_themes
+        if not self.is_built:
+            return  # build_ui picks up the themes itself
+        for key, combo in self.theme_controls.items():
+            current = combo.currentText()
+            themes = available_themes.get(self.theme_types[key], [])
+            set_combo_items(combo, [("(Not set)", "")] + [(theme, None) for theme in themes])
+            if current and current != "(Not set)":
+                with QSignalBlocker(combo):
+                    if combo.findText(current) < 0:
+                        combo.addItem(current)
+                    combo.setCurrentText(current)
+            else:
+                combo.setCurrentIndex(0)
+
     def update_theme_availability(self):
         """Update theme dropdown availability based on current DE."""
+        if not self.is_built:
+            return
         de = self.parent_window.get_current_de()
+        if de == self._last_de:
+            return  # Rules already applied for this DE
         
         # Define which themes are applicable for each DE
         theme_rules = {
@@ -406,6 +826,8 @@ class WorkspaceTab(QWidget):
                     combo.setToolTip(f"Select {theme_mapping[theme_key].lower()} for this workspace")
                 else:
                     combo.setToolTip(f"{theme_mapping[theme_key]} not applicable for {de.upper()}")
+
+        self._last_de = de
                 
     # --- SIGNAL HANDLERS ---
     
@@ -433,34 +855,67 @@ class WorkspaceTab(QWidget):
             text (str): Current mode selection ("Random" or "Sequential")
         """
         if text == "Random":
-            # Force 'n' for random mode
-            found_n = False
-            for i in range(self.order_combo.count()):
-                if self.order_combo.itemData(i) == "n":
-                    found_n = True
-                    self.order_combo.setCurrentIndex(i)
-                    break
-            if not found_n:
-                self.order_combo.addItem("Random (n)", "n")
-                self.order_combo.setCurrentIndex(self.order_combo.count() - 1)
-            self.order_combo.setEnabled(False)
+            self.set_random_order()
         else:
             self.order_combo.setEnabled(True)
             # Remove 'n' if exists
-            for i in range(self.order_combo.count()):
-                if self.order_combo.itemData(i) == "n":
-                    self.order_combo.removeItem(i)
-                    break
+            idx = self.order_combo._data_index.pop("n", None)
+            if idx is not None:
+                self.order_combo.removeItem(idx)
             self.order_combo.setCurrentIndex(0)
 
-    def update_icon_preview(self):
-        """Update live preview of selected workspace icon."""
+    def set_random_order(self):
+        """Force the 'n' order marker used by random mode and lock the combo."""
+        if not select_combo_data(self.order_combo, "n"):
+            self.order_combo.addItem("Random (n)", "n")
+            idx = self.order_combo.count() - 1
+            self.order_combo._data_index["n"] = idx
+            self.order_combo.setCurrentIndex(idx)
+        self.order_combo.setEnabled(False)
+
+    def showEvent(self, event):
+        """Build the tab on first display and refresh a stale preview."""
+        super().showEvent(event)
+        self.ensure_built()
+        if self._preview_dirty:
+            self.update_icon_preview()
+
+    def update_icon_preview(self, smooth=True):
+        """
+        Update live preview of selected workspace icon.
+        
+        Args:
+            smooth (bool): Use smooth scaling; False gives a fast preview while typing
+        """
+        # Hidden tabs defer the decode until they are shown
+        if not self.isVisible():
+            self._preview_dirty = True
+            return
+        self._preview_dirty = False
         path = self.icon_edit.text().strip()
-        if not path or not os.path.isfile(path):
-            path = DEFAULT_ICON if os.path.isfile(DEFAULT_ICON) else ""
+        st = _stat_file(path) if path else None
+        if st is None:
+            path = DEFAULT_ICON
+            st = _stat_file(path)
+            if st is None:
+                path = ""
+        # Key on the file's identity too: save_config() rewrites ICON_DIR
+        # icons in place under the same path
+        icon_key = (path, st.st_mtime_ns, st.st_size) if path else ("",)
+        if icon_key == self._last_icon_key and (self._last_icon_smooth or not smooth):
+            return
+        self._last_icon_key = icon_key
+        self._last_icon_smooth = smooth
         if path:
-            pix = QPixmap(path)
-            self.icon_preview.setPixmap(pix.scaled(60, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            # Reuse the already scaled pixmap while the file is unchanged
+            mode = "smooth" if smooth else "fast"
+            key = f"{path}|{st.st_mtime_ns}|{st.st_size}|60x60|{mode}"
+            scaled = QPixmapCache.find(key)
+            if scaled is None:
+                transform = Qt.SmoothTransformation if smooth else Qt.FastTransformation
+                scaled = QPixmap(path).scaled(60, 60, Qt.KeepAspectRatio, transform)
+                QPixmapCache.insert(key, scaled)
+            self.icon_preview.setPixmap(scaled)
         else:
             self.icon_preview.clear()
 
@@ -471,64 +926,50 @@ class WorkspaceTab(QWidget):
         Load settings from configuration section.
         
         Args:
-            config_section (SectionProxy): Configuration section for this workspace
+            config_section (dict): Configuration section for this workspace
         """
+        # Read the section once into a plain dict instead of per-key lookups
+        settings = dict(config_section)
+        if not self.is_built:
+            self._pending_section = settings
+            return
+
         # Basic settings
-        self.folder_edit.setText(config_section.get('folder', ''))
-        self.icon_edit.setText(config_section.get('icon', ''))
+        self.folder_edit.setText(settings.get('folder', ''))
+        self.icon_edit.setText(settings.get('icon', ''))
 
         # Timing
-        timing = config_section.get('timing', '5m')
-        for i in range(self.timing_combo.count()):
-            if self.timing_combo.itemData(i) == timing:
-                self.timing_combo.setCurrentIndex(i)
-                break
-        else:
+        timing = settings.get('timing', '5m')
+        if not select_combo_data(self.timing_combo, timing):
             self.timing_combo.setCurrentText("5 minutes")
 
         # Mode and order
-        mode = config_section.get('mode', 'random')
+        mode = settings.get('mode', 'random')
         self.mode_combo.setCurrentText(mode.title())
-        order = config_section.get('order', 'name_az')
+        order = settings.get('order', 'name_az')
         
         if mode == "random":
-            found_n = False
-            for i in range(self.order_combo.count()):
-                if self.order_combo.itemData(i) == "n":
-                    found_n = True
-                    self.order_combo.setCurrentIndex(i)
-                    break
-            if not found_n:
-                self.order_combo.addItem("Random (n)", "n")
-                self.order_combo.setCurrentIndex(self.order_combo.count() - 1)
-            self.order_combo.setEnabled(False)
+            self.set_random_order()
         else:
-            for i in range(self.order_combo.count()):
-                if self.order_combo.itemData(i) == order:
-                    self.order_combo.setCurrentIndex(i)
-                    break
+            select_combo_data(self.order_combo, order)
             self.order_combo.setEnabled(True)
 
         # Scaling
-        scaling = config_section.get('scaling', 'scaled')
-        for i in range(self.scaling_combo.count()):
-            if self.scaling_combo.itemData(i) == scaling:
-                self.scaling_combo.setCurrentIndex(i)
-                break
+        scaling = settings.get('scaling', 'scaled')
+        select_combo_data(self.scaling_combo, scaling)
 
         # Theme settings
         for key, combo in self.theme_controls.items():
-            theme_value = config_section.get(key, '')
+            theme_value = settings.get(key, '')
             if theme_value:
-                found = False
-                for i in range(combo.count()):
-                    if combo.itemText(i) == theme_value:
-                        combo.setCurrentIndex(i)
-                        found = True
-                        break
-                if not found:
-                    combo.addItem(theme_value)
-                    combo.setCurrentText(theme_value)
+                idx = combo.findText(theme_value)
+                if idx >= 0:
+                    combo.setCurrentIndex(idx)
+                else:
+                    # Keep a theme that isn't installed (anymore) selectable
+                    with QSignalBlocker(combo):
+                        combo.addItem(theme_value)
+                        combo.setCurrentText(theme_value)
             else:
                 combo.setCurrentIndex(0)  # "(Not set)"
 
@@ -537,25 +978,49 @@ class WorkspaceTab(QWidget):
         
         self.update_icon_preview()
 
-    def save_to_config(self, config_section):
+    def snapshot(self):
         """
-        Save settings to configuration section.
+        Read every setting from the widgets once.
         
-        Args:
-            config_section (SectionProxy): Configuration section for this workspace
+        Returns:
+            dict: Config values keyed like the workspace section; unset themes
+                map to "". None if the tab was never built, so nothing changed.
         """
-        config_section['folder'] = self.folder_edit.text().strip()
-        config_section['icon'] = self.icon_edit.text().strip()
-        config_section['timing'] = self.timing_combo.currentData() or '5m'
-        config_section['mode'] = self.mode_combo.currentText().lower()
-        config_section['order'] = self.order_combo.currentData() or 'name_az'
-        config_section['scaling'] = self.scaling_combo.currentData() or 'scaled'
+        if not self.is_built:
+            return None
+        values = {
+            'folder': self.folder_edit.text().strip(),
+            'icon': self.icon_edit.text().strip(),
+            'timing': self.timing_combo.currentData() or '5m',
+            'mode': self.mode_combo.currentText().lower(),
+            'order': self.order_combo.currentData() or 'name_az',
+            'scaling': self.scaling_combo.currentData() or 'scaled',
+        }
 
         # Theme settings
         for key, combo in self.theme_controls.items():
-            if combo.currentText() and combo.currentText() != "(Not set)":
-                config_section[key] = combo.currentText()
-            elif key in config_section:
+            text = combo.currentText()
+            values[key] = text if text != "(Not set)" else ""
+        return values
+
+    def save_to_config(self, config_section, values=None):
+        """
+        Save settings to configuration section.
+        
+        Args:
+            config_section (dict): Configuration section for this workspace
+            values (dict): Precomputed snapshot(); read from the widgets if omitted
+        """
+        if values is None:
+            values = self.snapshot()
+            if values is None:
+                return  # Never built; the section is unchanged
+
+        # Write everything back in one batch; unset themes are removed
+        config_section.update({key: value for key, value in values.items()
+                               if value or key not in self.theme_controls})
+        for key in self.theme_controls:
+            if not values[key] and key in config_section:
                 del config_section[key]
 
 # =============================================================================
@@ -586,13 +1051,124 @@ class AWPDashboard(QWidget):
                 f"Config file not found: {CONFIG_PATH}\n\nPlease run awp_setup.py first to create the initial configuration.")
             sys.exit(1)
 
-        self.config = configparser.ConfigParser()
-        self.config.read(CONFIG_PATH)
+        # Filled in by on_config_loaded once the background read finishes
+        self.config = None
+
+        # Ensure logos directory exists for icons copied on save
+        os.makedirs(ICON_DIR, exist_ok=True)
 
         self.workspace_tabs = []
+        self._tab_pool = []  # every tab created so far, hidden ones included
+        self.available_themes = None
+        self._loading = False
+        self._blanking_muting = False  # guards the combo/checkbox ping-pong
         self.setup_ui()
         self.setup_keybindings()
+        self.start_config_load()
+        self.start_theme_scan()
+        self.setup_theme_watcher()
+
+    def start_config_load(self):
+        """Parse the config file on a worker thread; saving waits for it."""
+        self.save_btn.setEnabled(False)
+        self._config_loader = ConfigLoader(CONFIG_PATH, self)
+        self._config_loader.loaded.connect(self.on_config_loaded)
+        self._config_loader.start()
+
+    def on_config_loaded(self, config):
+        """
+        Create the workspace tabs and populate every widget from the config.
+        
+        Args:
+            config (FastConfigParser): Parsed configuration
+        """
+        self.config = config
+        # A missing [general] section or a bad count must not raise inside
+        # this slot; fall back to the default workspace count
+        try:
+            num_workspaces = int(self.config.get('general', 'workspaces', '3'))
+        except ValueError:
+            num_workspaces = 3
+        for i in range(1, num_workspaces + 1):
+            tab = self._pooled_tab(i)
+            self.workspace_tabs.append(tab)
+            self.tab_widget.addTab(tab, f"Workspace {i}")
         self.load_config()
+        self.save_btn.setEnabled(True)
+
+    def start_theme_scan(self):
+        """Discover system themes in the background and fill the tabs when done."""
+        scanner = ThemeScanner()
+        # Keep the signal holder alive; the pool deletes the runnable itself
+        self._theme_scan_signals = scanner.signals
+        scanner.signals.finished.connect(self.on_themes_scanned)
+        QThreadPool.globalInstance().start(scanner)
+
+    def setup_theme_watcher(self):
+        """Rescan themes when a theme base directory gains or loses entries."""
+        self._theme_watcher = QFileSystemWatcher(self)
+        self._theme_bases_dirty = False
+        self._update_theme_watches()
+        # Installing a theme touches a directory several times; rescan once
+        self._theme_rescan = QTimer(self)
+        self._theme_rescan.setSingleShot(True)
+        self._theme_rescan.setInterval(500)
+        self._theme_rescan.timeout.connect(self.on_theme_dirs_changed)
+        self._theme_watcher.directoryChanged.connect(self.on_theme_dir_event)
+
+    def _update_theme_watches(self):
+        """
+        Watch every theme base directory, or its nearest existing parent.
+        
+        Watching the parent of a missing base (e.g. ~ for ~/.themes) is what
+        notices the first user theme being installed.
+        
+        Returns:
+            bool: True if a base directory became watched
+        """
+        wanted = set()
+        for path in _THEME_BASES:
+            while not os.path.isdir(path):
+                parent = os.path.dirname(path)
+                if parent == path:
+                    break
+                path = parent
+            wanted.add(path)
+        current = set(self._theme_watcher.directories())
+        stale = current - wanted
+        if stale:
+            self._theme_watcher.removePaths(sorted(stale))
+        added = wanted - current
+        if added:
+            self._theme_watcher.addPaths(sorted(added))
+        return not added.isdisjoint(_THEME_BASES)
+
+    def on_theme_dir_event(self, path):
+        """Note which kind of watched directory changed and debounce the rescan."""
+        if path in _THEME_BASES:
+            self._theme_bases_dirty = True
+        self._theme_rescan.start()
+
+    def on_theme_dirs_changed(self):
+        """Drop the cached theme scan and repopulate the tabs in the background."""
+        # Changes in a watched parent only matter once they create a base
+        new_base = self._update_theme_watches()
+        if not (self._theme_bases_dirty or new_base):
+            return
+        self._theme_bases_dirty = False
+        _invalidate_theme_cache()
+        self.start_theme_scan()
+
+    def on_themes_scanned(self, available_themes):
+        """
+        Populate every workspace tab with the finished theme scan.
+        
+        Args:
+            available_themes (dict): Result of get_available_themes()
+        """
+        self.available_themes = available_themes
+        for tab in self._tab_pool:
+            tab.populate_themes(available_themes)
 
     def setup_ui(self):
         """Initialize and arrange all user interface components."""
@@ -610,12 +1186,7 @@ class AWPDashboard(QWidget):
         general_tab = self.create_general_tab()
         self.tab_widget.addTab(general_tab, "General Settings")
 
-        # Workspace tabs
-        num_workspaces = int(self.config['general'].get('workspaces', 3))
-        for i in range(1, num_workspaces + 1):
-            tab = WorkspaceTab(i, self)
-            self.workspace_tabs.append(tab)
-            self.tab_widget.addTab(tab, f"Workspace {i}")
+        # Workspace tabs are added by on_config_loaded
 
         layout.addWidget(self.tab_widget)
 
@@ -676,7 +1247,7 @@ class AWPDashboard(QWidget):
         de_row.addWidget(QLabel("Desktop Environment:"))
         self.de_combo = QComboBox()
         self.de_combo.setMaximumWidth(200)
-        self.de_combo.addItems(["xfce", "gnome", "cinnamon", "mate", "generic", "unknown"])
+        self.de_combo.addItems(list(DE_ITEMS))
         self.de_combo.setToolTip("Select your desktop environment for proper theme integration")
         self.de_combo.currentTextChanged.connect(self.on_de_changed)
         de_row.addWidget(self.de_combo)
@@ -687,7 +1258,7 @@ class AWPDashboard(QWidget):
         session_row.addWidget(QLabel("Session Type:"))
         self.session_combo = QComboBox()
         self.session_combo.setMaximumWidth(200)
-        self.session_combo.addItems(["x11", "wayland"])
+        self.session_combo.addItems(list(SESSION_ITEMS))
         self.session_combo.setToolTip("Display server protocol (X11 or Wayland)")
         session_row.addWidget(self.session_combo)
         session_row.addStretch()
@@ -699,14 +1270,8 @@ class AWPDashboard(QWidget):
         blanking_row.addWidget(QLabel("Timeout:"))
         self.blanking_combo = QComboBox()
         self.blanking_combo.setMaximumWidth(150)
-        self.blanking_combo.addItem("Disabled", "0")
-        self.blanking_combo.addItem("30 seconds", "30")
-        self.blanking_combo.addItem("1 minute", "60")
-        self.blanking_combo.addItem("5 minutes", "300")
-        self.blanking_combo.addItem("10 minutes", "600")
-        self.blanking_combo.addItem("20 minutes", "1200")
-        self.blanking_combo.addItem("30 minutes", "1800")
-        self.blanking_combo.addItem("1 hour", "3600")
+        for text, data in BLANKING_ITEMS:
+            self.blanking_combo.addItem(text, data)
         self.blanking_combo.setToolTip("Time before screen blanks/sleeps (XFCE/X11 only)")
         self.blanking_combo.currentTextChanged.connect(self.on_blanking_changed)
         blanking_row.addWidget(self.blanking_combo)
@@ -724,10 +1289,15 @@ class AWPDashboard(QWidget):
         ws_row.addWidget(QLabel("Number of workspaces:"))
         self.ws_count_combo = QComboBox()
         self.ws_count_combo.setMaximumWidth(80)
-        for i in range(1, 9):
-            self.ws_count_combo.addItem(str(i), str(i))
+        for count in WS_COUNT_ITEMS:
+            self.ws_count_combo.addItem(count, count)
         self.ws_count_combo.setToolTip("Total number of workspaces to configure (1-8)")
         self.ws_count_combo.currentTextChanged.connect(self.on_workspace_count_changed)
+        # Resize once the user settles on a value instead of on every step
+        self._ws_count_timer = QTimer(self)
+        self._ws_count_timer.setSingleShot(True)
+        self._ws_count_timer.setInterval(150)
+        self._ws_count_timer.timeout.connect(self.apply_workspace_count)
         ws_row.addWidget(self.ws_count_combo)
         ws_row.addStretch()
         layout.addLayout(ws_row)
@@ -742,7 +1312,9 @@ class AWPDashboard(QWidget):
 
     def on_de_changed(self, new_de):
         """Update all workspace tabs when DE changes."""
-        for tab in self.workspace_tabs:
+        if self._loading:
+            return  # load_config refreshes the tabs once at the end
+        for tab in self._tab_pool:
             if hasattr(tab, 'update_theme_availability'):
                 tab.update_theme_availability()
 
@@ -753,12 +1325,14 @@ class AWPDashboard(QWidget):
         Args:
             text (str): New timeout selection
         """
-        if text == "Disabled":
-            self.blanking_pause_cb.setChecked(True)
-            self.blanking_pause_cb.setEnabled(True)
-        else:
-            self.blanking_pause_cb.setChecked(False)
+        if self._blanking_muting:
+            return  # Change originated from on_blanking_pause_toggled
+        self._blanking_muting = True
+        try:
+            self.blanking_pause_cb.setChecked(text == "Disabled")
             self.blanking_pause_cb.setEnabled(True)
+        finally:
+            self._blanking_muting = False
 
     def on_blanking_pause_toggled(self, checked):
         """
@@ -767,67 +1341,113 @@ class AWPDashboard(QWidget):
         Args:
             checked (bool): Whether blanking is paused
         """
-        if checked:
-            self.blanking_combo.setCurrentText("Disabled")
-        else:
-            # Set to a reasonable default when unpausing
-            self.blanking_combo.setCurrentText("20 minutes")
+        if self._blanking_muting:
+            return  # Change originated from on_blanking_changed
+        self._blanking_muting = True
+        try:
+            if checked:
+                self.blanking_combo.setCurrentText("Disabled")
+            else:
+                # Set to a reasonable default when unpausing
+                self.blanking_combo.setCurrentText("20 minutes")
+        finally:
+            self._blanking_muting = False
 
     def on_workspace_count_changed(self, new_count):
         """
-        Update workspace tabs when count changes.
+        Schedule a workspace tab update when count changes.
         
         Args:
             new_count (str): New workspace count
         """
         if not new_count:
             return
+        self._ws_count_timer.start()
+
+    def apply_workspace_count(self):
+        """Show or hide pooled workspace tabs to match the selected count."""
+        new_count = self.ws_count_combo.currentText()
+        if not new_count or self.config is None:
+            return  # on_config_loaded creates the initial tabs
             
         new_count = int(new_count)
         current_count = len(self.workspace_tabs)
         
         if new_count > current_count:
-            # Add new tabs
+            # Add new tabs, reusing ones hidden earlier
             for i in range(current_count + 1, new_count + 1):
-                tab = WorkspaceTab(i, self)
-                self.workspace_tabs.append(tab)
-                self.tab_widget.addTab(tab, f"Workspace {i}")
+                self.tab_widget.addTab(self._pooled_tab(i), f"Workspace {i}")
         elif new_count < current_count:
-            # Remove extra tabs
+            # Remove extra tabs but keep them pooled
             for i in range(current_count, new_count, -1):
                 self.tab_widget.removeTab(i)
-                self.workspace_tabs.pop()
+        self.workspace_tabs = self._tab_pool[:new_count]
+
+    def _pooled_tab(self, index):
+        """
+        Get the tab for a workspace, creating it on first use.
+        
+        Args:
+            index (int): Workspace number (1-based)
+            
+        Returns:
+            WorkspaceTab: Tab instance kept alive across count changes
+        """
+        while len(self._tab_pool) < index:
+            self._tab_pool.append(
+                WorkspaceTab(len(self._tab_pool) + 1, self, self.available_themes)
+            )
+        return self._tab_pool[index - 1]
+
+    @contextmanager
+    def _suppress_signals(self):
+        """Block change signals of the general widgets for a batch of updates."""
+        widgets = [self.de_combo, self.session_combo, self.blanking_combo,
+                   self.blanking_pause_cb, self.ws_count_combo]
+        previous = [widget.blockSignals(True) for widget in widgets]
+        try:
+            yield
+        finally:
+            for widget, blocked in zip(widgets, previous):
+                widget.blockSignals(blocked)
 
     def load_config(self):
         """Load all settings from configuration file."""
-        # General settings
-        general = self.config['general']
-        self.de_combo.setCurrentText(general.get('os_detected', 'unknown'))
-        self.session_combo.setCurrentText(general.get('session_type', 'x11'))
-    
-        # Screen blanking settings
-        blanking_timeout = general.get('blanking_timeout', '0')
-        blanking_paused = general.get('blanking_pause', 'false').lower() == 'true'
-    
-        if blanking_paused or blanking_timeout == '0':
-            self.blanking_combo.setCurrentText("Disabled")
-            self.blanking_pause_cb.setChecked(True)
-        else:
-            for i in range(self.blanking_combo.count()):
-                if self.blanking_combo.itemData(i) == blanking_timeout:
-                    self.blanking_combo.setCurrentIndex(i)
-                    break
-            self.blanking_pause_cb.setChecked(False)
-    
-        # Workspace count
-        ws_count = general.get('workspaces', '3')
-        self.ws_count_combo.setCurrentText(ws_count)
+        self._loading = True
+        try:
+            with self._suppress_signals():
+                # General settings
+                general = self.config['general'] if 'general' in self.config else {}
+                self.de_combo.setCurrentText(general.get('os_detected', 'unknown'))
+                self.session_combo.setCurrentText(general.get('session_type', 'x11'))
+            
+                # Screen blanking settings
+                blanking_timeout = general.get('blanking_timeout', '0')
+                blanking_paused = general.get('blanking_pause', 'false').lower() == 'true'
+            
+                if blanking_paused or blanking_timeout == '0':
+                    self.blanking_combo.setCurrentText("Disabled")
+                    self.blanking_pause_cb.setChecked(True)
+                else:
+                    idx = BLANKING_INDEX.get(blanking_timeout)
+                    if idx is not None:
+                        self.blanking_combo.setCurrentIndex(idx)
+                    self.blanking_pause_cb.setChecked(False)
+            
+                # Workspace count
+                ws_count = general.get('workspaces', '3')
+                self.ws_count_combo.setCurrentText(ws_count)
 
-        # Workspace settings
-        for i, tab in enumerate(self.workspace_tabs, 1):
-            section_name = f"ws{i}"
-            if section_name in self.config:
-                tab.load_from_config(self.config[section_name])
+            # Workspace settings
+            for i, tab in enumerate(self.workspace_tabs, 1):
+                section_name = f"ws{i}"
+                if section_name in self.config:
+                    tab.load_from_config(self.config[section_name])
+        finally:
+            self._loading = False
+
+        # Apply the loaded DE to every tab once, now that signals are back
+        self.on_de_changed(self.de_combo.currentText())
 
     def save_config(self):
         """
@@ -843,50 +1463,50 @@ class AWPDashboard(QWidget):
             Exception: If configuration file operations fail
         """
         try:
-            # Read current config
-            current_config = configparser.ConfigParser()
-            current_config.read(CONFIG_PATH)
-    
-            # Create a copy to modify
-            new_config = configparser.ConfigParser()
-            new_config.read(CONFIG_PATH)
+            # Icon paths repeat across workspaces; stat each one once per save
+            @functools.lru_cache(maxsize=None)
+            def _isfile(path):
+                return _stat_file(path) is not None
+
+            # Compare against the in-memory config and edit a copy of it
+            current_config = self.config
+            new_config = copy.deepcopy(self.config)
     
             has_changes = False
     
             # Update general section if changed
-            if self.has_general_changes(current_config):
+            general = self.has_general_changes(current_config)
+            if general is not None:
                 has_changes = True
-                new_config['general']['os_detected'] = self.de_combo.currentText()
-                new_config['general']['session_type'] = self.session_combo.currentText()
-                if self.blanking_pause_cb.isChecked():
-                    new_config['general']['blanking_timeout'] = '0'
-                    new_config['general']['blanking_pause'] = 'true'
-                else:
-                    new_config['general']['blanking_timeout'] = str(self.blanking_combo.currentData() or '0')
-                    new_config['general']['blanking_pause'] = 'false'
-                new_config['general']['workspaces'] = self.ws_count_combo.currentText()
-    
-            # Ensure logos directory exists
-            os.makedirs(ICON_DIR, exist_ok=True)
+                new_config.add_section('general')
+                new_config['general'].update(general)
     
             # Update workspace sections if changed
             for i, tab in enumerate(self.workspace_tabs, 1):
                 section_name = f"ws{i}"
-                old_section = current_config[section_name] if current_config.has_section(section_name) else {}
-            
-                if self.has_workspace_changes(tab, old_section):
+                if current_config.has_section(section_name):
+                    old_section = current_config[section_name]
+                    values = self.has_workspace_changes(tab, old_section)
+                else:
+                    # A workspace added since the last save needs a section even
+                    # if its tab was never opened; the daemon skips workspaces
+                    # without one
+                    old_section = {}
+                    tab.ensure_built()
+                    values = tab.snapshot()
+                if values is not None:
                     has_changes = True
                     if not new_config.has_section(section_name):
                         new_config.add_section(section_name)
                 
                     # Handle icon copying and color extraction
-                    folder_path = tab.folder_edit.text().strip()
-                    folder_name = os.path.basename(folder_path.rstrip("/")) if folder_path else f"ws{i}"
+                    folder_path = values['folder']
+                    folder_name = os.path.split(folder_path.rstrip(os.sep))[1] if folder_path else f"ws{i}"
                     old_icon_path = old_section.get('icon', '')
-                    new_icon_path = tab.icon_edit.text().strip()
+                    new_icon_path = values['icon']
                     icon_changed = (new_icon_path != old_icon_path)
                 
-                    if icon_changed and new_icon_path and os.path.isfile(new_icon_path):
+                    if icon_changed and new_icon_path and _isfile(new_icon_path):
                         # Copy new icon to logos folder
                         _, ext = os.path.splitext(new_icon_path)
                         if not ext:
@@ -894,20 +1514,27 @@ class AWPDashboard(QWidget):
                         dest_icon = os.path.join(ICON_DIR, f"{folder_name}{ext}")
                     
                         try:
-                            shutil.copy(new_icon_path, dest_icon)
+                            if not _icon_up_to_date(new_icon_path, dest_icon):
+                                shutil.copyfile(new_icon_path, dest_icon)
+                                # _icon_up_to_date() compares mtimes, so carry the source's over
+                                src_st = os.stat(new_icon_path)
+                                os.utime(dest_icon, ns=(src_st.st_atime_ns, src_st.st_mtime_ns))
                             final_icon_path = dest_icon
                         except Exception as e:
                             print(f"Warning: Could not copy icon for {section_name}: {e}")
                             final_icon_path = new_icon_path
                     else:
-                        final_icon_path = old_icon_path if old_icon_path and os.path.isfile(old_icon_path) else DEFAULT_ICON
+                        final_icon_path = old_icon_path if old_icon_path and _isfile(old_icon_path) else DEFAULT_ICON
                 
                     # Save workspace config
-                    tab.save_to_config(new_config[section_name])
+                    tab.save_to_config(new_config[section_name], values)
                     new_config[section_name]['icon'] = final_icon_path
                 
-                    # Update icon color
-                    color = get_icon_color(final_icon_path)
+                    # Update icon color; an unchanged icon keeps its stored color
+                    if not icon_changed and old_section.get('icon_color'):
+                        color = old_section['icon_color']
+                    else:
+                        color = get_icon_color(final_icon_path)
                     if color:
                         new_config[section_name]['icon_color'] = color
                         new_config[section_name]['color_variable'] = f"{section_name}_color"
@@ -915,26 +1542,60 @@ class AWPDashboard(QWidget):
                         new_config[section_name]['icon_color'] = old_section.get('icon_color', '')
                         new_config[section_name]['color_variable'] = old_section.get('color_variable', '')
     
+            if has_changes:
+                # Edits that round-trip to the same file are not worth a write
+                buf = io.StringIO()
+                new_config.write(buf)
+                data = buf.getvalue().encode('utf-8')
+                try:
+                    with open(CONFIG_PATH, 'rb') as f:
+                        has_changes = f.read() != data
+                except OSError:
+                    pass
+
             if not has_changes:
                 QMessageBox.information(self, "No Changes", "No changes detected.")
                 return
     
             # Backup and save
-            if os.path.exists(CONFIG_PATH):
-                shutil.copy(CONFIG_PATH, CONFIG_PATH + ".bak")
+            write_config_atomic(data, CONFIG_PATH)
         
-            with open(CONFIG_PATH, 'w') as f:
-                new_config.write(f)
-        
-            # Reload config to update UI
-            self.config.read(CONFIG_PATH)
-            self.load_config()
+            # The written config is already in memory; only the icon fields
+            # need syncing to the copied logo paths
+            self.config = new_config
+            for i, tab in enumerate(self.workspace_tabs, 1):
+                if not tab.is_built:
+                    continue
+                icon = new_config.get(f"ws{i}", 'icon', '')
+                if tab.icon_edit.text().strip() != icon:
+                    with QSignalBlocker(tab.icon_edit):
+                        tab.icon_edit.setText(icon)
         
             QMessageBox.information(self, "Success", "Configuration saved!")
     
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save:\n{str(e)}")
 
+    def _general_snapshot(self):
+        """
+        Read the general settings from the widgets once.
+        
+        Returns:
+            dict: Values keyed like the [general] section
+        """
+        if self.blanking_pause_cb.isChecked():
+            blanking_timeout, blanking_pause = '0', 'true'
+        else:
+            blanking_timeout = str(self.blanking_combo.currentData() or '0')
+            blanking_pause = 'false'
+        return {
+            'os_detected': self.de_combo.currentText(),
+            'session_type': self.session_combo.currentText(),
+            'blanking_timeout': blanking_timeout,
+            'blanking_pause': blanking_pause,
+            'workspaces': self.ws_count_combo.currentText(),
+        }
+
     def get_new_general_value(self, key):
         """
         Get the new value for a general setting.
@@ -945,58 +1606,27 @@ class AWPDashboard(QWidget):
         Returns:
             str: New value for the setting
         """
-        if key == 'os_detected':
-            return self.de_combo.currentText()
-        elif key == 'session_type':
-            return self.session_combo.currentText()
-        elif key == 'blanking_timeout':
-            if self.blanking_pause_cb.isChecked():
-                return '0'
-            else:
-                return str(self.blanking_combo.currentData() or '0')
-        elif key == 'blanking_pause':
-            return str(self.blanking_pause_cb.isChecked()).lower()
-        elif key == 'workspaces':
-            return self.ws_count_combo.currentText()
-        return ''
+        return self._general_snapshot().get(key, '')
         
     def has_general_changes(self, current_config):
         """
         Check if general section has changes.
         
         Args:
-            current_config (ConfigParser): Current configuration
+            current_config (FastConfigParser): Current configuration
             
         Returns:
-            bool: True if general section has changes
+            dict: New general values if anything changed, otherwise None
         """
+        new = self._general_snapshot()
         if not current_config.has_section('general'):
-            return True
+            return new
         
         general = current_config['general']
-        current_de = general.get('os_detected', '')
-        current_session = general.get('session_type', '')
-        current_blanking_timeout = general.get('blanking_timeout', '0')
-        current_blanking_pause = general.get('blanking_pause', 'false')
-        current_workspaces = general.get('workspaces', '3')
-    
-        new_de = self.de_combo.currentText()
-        new_session = self.session_combo.currentText()
-        new_workspaces = self.ws_count_combo.currentText()
-    
-        # Handle blanking safely
-        if self.blanking_pause_cb.isChecked():
-            new_blanking_timeout = '0'
-            new_blanking_pause = 'true'
-        else:
-            new_blanking_timeout = str(self.blanking_combo.currentData() or '0')
-            new_blanking_pause = 'false'
-    
-        return (new_de != current_de or
-                new_session != current_session or
-                new_blanking_timeout != current_blanking_timeout or
-                new_blanking_pause != current_blanking_pause or
-                new_workspaces != current_workspaces)
+        for key, value in new.items():
+            if value != general.get(key, _GENERAL_DEFAULTS[key]):
+                return new
+        return None
 
     def has_workspace_changes(self, tab, old_section):
         """
@@ -1004,34 +1634,24 @@ class AWPDashboard(QWidget):
         
         Args:
             tab (WorkspaceTab): Workspace tab to check
-            old_section (SectionProxy): Original configuration section
+            old_section (dict): Original configuration section
             
         Returns:
-            bool: True if workspace has changes
+            dict: The tab's snapshot() if anything changed, otherwise None
         """
-        # Check basic settings
-        if (tab.folder_edit.text().strip() != old_section.get('folder', '') or
-            tab.icon_edit.text().strip() != old_section.get('icon', '') or
-            (tab.timing_combo.currentData() or '5m') != old_section.get('timing', '5m') or
-            tab.mode_combo.currentText().lower() != old_section.get('mode', 'random') or
-            (tab.order_combo.currentData() or 'name_az') != old_section.get('order', 'name_az') or
-            (tab.scaling_combo.currentData() or 'scaled') != old_section.get('scaling', 'scaled')):
-            return True
-        
-        # Check theme settings
-        for key, combo in tab.theme_controls.items():
-            new_theme = combo.currentText() if combo.currentText() != "(Not set)" else ""
-            old_theme = old_section.get(key, '')
-            if new_theme != old_theme:
-                return True
-        
-        return False
+        values = tab.snapshot()
+        if values is None:
+            return None  # Never opened, so still matches the config
+        for key, value in values.items():
+            if value != old_section.get(key, _WORKSPACE_DEFAULTS.get(key, '')):
+                return values
+        return None
 
     def backup_config(self):
         """Create backup of current configuration file."""
         if os.path.exists(CONFIG_PATH):
             backup_path = CONFIG_PATH + ".backup"
-            shutil.copy(CONFIG_PATH, backup_path)
+            shutil.copyfile(CONFIG_PATH, backup_path)
             QMessageBox.information(self, "Backup Created", 
                                   f"Configuration backed up to:\n{backup_path}")
 
@@ -1042,6 +1662,8 @@ class AWPDashboard(QWidget):
 if __name__ == "__main__":
     """Main application entry point."""
     app = QApplication(sys.argv)
+    # Room for the scaled previews of all eight workspaces (KB)
+    QPixmapCache.setCacheLimit(10240)
     window = AWPDashboard()
     window.show()
     sys.exit(app.exec_())
@@ -8,15 +8,39 @@ and workspace-aware desktop customization.
 Part of the AWP wallpaper automation system.
 """
 import configparser
+import functools
 import json
 import os
+import signal
 import sys
 import time
 import random
+import re
+import select
 import subprocess
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from datetime import datetime
 
+try:
+    from gi.repository import Gio, GLib
+    HAS_GIO = True
+except ImportError:
+    HAS_GIO = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from Xlib import X, display as xdisplay, error as xerror
+    from Xlib.ext import randr
+    HAS_XLIB = True
+except ImportError:
+    HAS_XLIB = False
+
 os.environ['NO_AT_BRIDGE'] = '1'
 
 # =============================================================================
@@ -58,6 +82,25 @@ BLANKING_PAUSE = False
 BLANKING_TIMEOUT = 0
 BLANKING_FORMATTED = "off"
 
+# Parsed config cache, keyed by the file's mtime (see get_config_cached)
+_CONFIG_CACHE = {"mtime": None, "config": None, "snapshot": None}
+
+# Config object the globals above were last loaded from (see load_config)
+_LOADED_CONFIG = None
+
+# Last contents written to CONKY_STATE_PATH (see update_conky_state)
+_LAST_CONKY_PAYLOAD = None
+
+# Parsed state file, keyed by its (mtime, inode) (see load_state)
+_STATE_CACHE = {"key": None, "state": None}
+
+# Image listings per folder: {folder: (mtime_ns, [Path, ...])}
+_IMG_CACHE = {}
+
+# Read end of the signal wakeup pipe, and whether SIGHUP asked for a reload
+_WAKEUP_FD = None
+_RELOAD_REQUESTED = False
+
 # =============================================================================
 # DESKTOP ENVIRONMENT SCALING MAPPINGS
 # =============================================================================
@@ -70,13 +113,66 @@ SCALING_MATE = {'centered': 'centered', 'scaled': 'scaled', 'zoomed': 'zoom'}
 # XFCE BACKEND FUNCTIONS
 # =============================================================================
 
+@functools.lru_cache(maxsize=None)
+def xfce_get_xfconf_proxy():
+    """Get a D-Bus proxy for xfconfd, or None if unavailable (opened once)."""
+    if not HAS_GIO:
+        return None
+    try:
+        bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+        # No signal subscription or property cache: the daemon never runs
+        # a GLib main loop, so PropertyChanged emissions (including those
+        # caused by our own SetProperty calls) would pile up unprocessed
+        flags = (Gio.DBusProxyFlags.DO_NOT_CONNECT_SIGNALS
+                 | Gio.DBusProxyFlags.DO_NOT_LOAD_PROPERTIES)
+        return Gio.DBusProxy.new_sync(
+            bus, flags, None,
+            "org.xfce.Xfconf", "/org/xfce/Xfconf", "org.xfce.Xfconf", None
+        )
+    except GLib.Error as e:
+        print(f"[AWP] Xfconf D-Bus unavailable, using xfconf-query: {e}")
+        return None
+
+def xfconf_set(channel: str, prop: str, value, check: bool = False):
+    """
+    Set an xfconf property, creating it if missing.
+
+    Uses one in-process D-Bus connection to xfconfd instead of forking
+    xfconf-query per property; falls back to xfconf-query if D-Bus fails.
+
+    Args:
+        channel (str): Xfconf channel (e.g., 'xfce4-desktop')
+        prop (str): Property path (e.g., '/Net/ThemeName')
+        value: Property value (bool, int or str)
+        check (bool): Raise CalledProcessError if the fallback fails
+    """
+    if isinstance(value, bool):
+        vtype, cli_type, cli_value = 'b', 'bool', str(value).lower()
+    elif isinstance(value, int):
+        vtype, cli_type, cli_value = 'i', 'int', str(value)
+    else:
+        vtype, cli_type, cli_value = 's', 'string', str(value)
+
+    proxy = xfce_get_xfconf_proxy()
+    if proxy is not None:
+        try:
+            proxy.call_sync(
+                "SetProperty",
+                GLib.Variant('(ssv)', (channel, prop, GLib.Variant(vtype, value))),
+                Gio.DBusCallFlags.NONE, -1, None
+            )
+            return
+        except GLib.Error as e:
+            print(f"[AWP] Xfconf SetProperty failed for {prop}: {e}")
+
+    subprocess.run([
+        "xfconf-query", "-c", channel, "-p", prop,
+        "--set", cli_value, "--create", "--type", cli_type
+    ], check=check)
+
 def xfce_force_single_workspace_off():
     """Disable single workspace mode in XFCE."""
-    subprocess.run([
-        "xfconf-query", "-c", "xfce4-desktop",
-        "-p", "/backdrop/single-workspace-mode",
-        "--set", "false", "--create"
-    ])
+    xfconf_set("xfce4-desktop", "/backdrop/single-workspace-mode", False)
 
 def xfce_configure_screen_blanking(timeout_seconds: int):
     """
@@ -97,154 +193,202 @@ def xfce_configure_screen_blanking(timeout_seconds: int):
         subprocess.run(["xset", "dpms", str(timeout_seconds), str(timeout_seconds), str(timeout_seconds)], check=False)
         print(f"[AWP] Screen blanking set to {timeout_seconds}s")
 
-def xfce_get_monitors_for_workspace(ws_num: int):
-    """Get list of monitors for specified XFCE workspace."""
+_XFCE_LAST_IMAGE_RE = re.compile(r"^/backdrop/screen0/(monitor[^/]+)/workspace(\d+)/last-image$")
+
+@functools.lru_cache(maxsize=1)
+def xfce_get_all_monitors() -> dict:
+    """
+    Get monitors for every XFCE workspace from one `xfconf-query -l`.
+    
+    Cached since monitor topology rarely changes; the cache is cleared by
+    invalidate_monitor_cache() on SIGUSR1 or a RandR change.
+    
+    Returns:
+        dict: {ws_num: tuple of monitor names, sorted}
+    """
     props = subprocess.check_output(
         ["xfconf-query", "-c", "xfce4-desktop", "-l"], text=True
     ).splitlines()
-    monitors = []
+    found = {}
     for p in props:
-        if f"/workspace{ws_num}/last-image" in p:
-            parts = p.split("/")
-            if len(parts) >= 6 and parts[3].startswith("monitor"):
-                monitors.append(parts[3])
-    return sorted(set(monitors))
+        m = _XFCE_LAST_IMAGE_RE.match(p)
+        if m:
+            found.setdefault(int(m.group(2)), set()).add(m.group(1))
+    return {ws: tuple(sorted(mons)) for ws, mons in found.items()}
+
+def xfce_get_monitors_for_workspace(ws_num: int):
+    """
+    Get monitors for specified XFCE workspace.
+    
+    xfdesktop only creates a workspace's last-image properties once that
+    workspace is used (and may not be running yet at login), so a miss
+    re-queries instead of trusting the cached map.
+    """
+    monitors = xfce_get_all_monitors().get(ws_num)
+    if monitors is None:
+        xfce_get_all_monitors.cache_clear()
+        monitors = xfce_get_all_monitors().get(ws_num, ())
+    return monitors
+
+# Last (monitors, image_path, style_code) written per XFCE workspace
+_XFCE_APPLIED = {}
+
+# Set when an xfdesktop repaint is due (see flush_desktop_reload)
+_XFDESKTOP_RELOAD_PENDING = False
 
 def xfce_set_wallpaper(ws_num: int, image_path: str, scaling: str):
     """Set wallpaper for XFCE workspace with specified scaling."""
+    global _XFDESKTOP_RELOAD_PENDING
     style_code = SCALING_XFCE.get(scaling, 5)
-    for mon in xfce_get_monitors_for_workspace(ws_num):
-        subprocess.run([
-            "xfconf-query",
-            "--channel", "xfce4-desktop",
-            "--property", f"/backdrop/screen0/{mon}/workspace{ws_num}/last-image",
-            "--set", image_path,
-            "--create"
-        ])
-        subprocess.run([
-            "xfconf-query",
-            "--channel", "xfce4-desktop", 
-            "--property", f"/backdrop/screen0/{mon}/workspace{ws_num}/image-style",
-            "--set", str(style_code),
-            "--create"
-        ])
-    subprocess.run(["xfdesktop", "--reload"])
+    monitors = xfce_get_monitors_for_workspace(ws_num)
+    applied = (monitors, image_path, style_code)
+    previous = _XFCE_APPLIED.get(ws_num)
+    if applied == previous:
+        return
+    for mon in monitors:
+        base = f"/backdrop/screen0/{mon}/workspace{ws_num}"
+        xfconf_set("xfce4-desktop", f"{base}/last-image", image_path)
+        xfconf_set("xfce4-desktop", f"{base}/image-style", style_code)
+    # xfdesktop follows the xfce4-desktop channel itself; only force a full
+    # repaint the first time or when the monitor set changed, and leave it
+    # to flush_desktop_reload() so several changes share one repaint
+    if previous is None or previous[0] != monitors:
+        _XFDESKTOP_RELOAD_PENDING = True
+    _XFCE_APPLIED[ws_num] = applied
+
+def flush_desktop_reload():
+    """Run one pending `xfdesktop --reload` requested by xfce_set_wallpaper."""
+    global _XFDESKTOP_RELOAD_PENDING
+    if _XFDESKTOP_RELOAD_PENDING:
+        _XFDESKTOP_RELOAD_PENDING = False
+        subprocess.run(["xfdesktop", "--reload"])
+
+def xfconf_get(channel: str, prop: str):
+    """
+    Read an xfconf property over D-Bus.
+    
+    Returns:
+        Property value, or None if it is unset or D-Bus is unavailable
+    """
+    proxy = xfce_get_xfconf_proxy()
+    if proxy is None:
+        return None
+    try:
+        return proxy.call_sync(
+            "GetProperty", GLib.Variant('(ss)', (channel, prop)),
+            Gio.DBusCallFlags.NONE, -1, None
+        ).unpack()[0]
+    except GLib.Error:
+        return None
 
 def xfce_set_icon(icon_path: str):
     """
     Set the Whisker Menu icon for XFCE.
     
+    Whisker Menu follows its xfconf properties live, so when xfconfd is
+    reachable the icon is set in place; the panel is only restarted by the
+    XML fallback (xfce_set_icon_xml).
+    
+    Args:
+        icon_path (str): Full path to icon image file
+    """
+    if xfce_get_xfconf_proxy() is None:
+        xfce_set_icon_xml(icon_path)
+        return
+    
+    if xfconf_get("xfce4-panel", "/plugins/plugin-1") != "whiskermenu":
+        print("Error setting XFCE icon: plugin-1 is not the Whisker Menu")
+        return
+    if xfconf_get("xfce4-panel", "/plugins/plugin-1/button-icon") == icon_path:
+        return
+    xfconf_set("xfce4-panel", "/plugins/plugin-1/button-icon", icon_path)
+    print(f"Set XFCE icon to: {icon_path}")
+
+def xfce_set_icon_xml(icon_path: str):
+    """
+    Set the Whisker Menu icon by editing xfce4-panel.xml directly.
+    
+    Used when xfconfd can't be reached over D-Bus; requires restarting
+    xfconfd and the panel to take effect.
+    
     Args:
         icon_path (str): Full path to icon image file
     """
     config_file = os.path.expanduser("~/.config/xfce4/xfconf/xfce-perchannel-xml/xfce4-panel.xml")
     
-    escaped_icon_path = icon_path.replace("/", "\\/")
+    try:
+        tree = ET.parse(config_file)
+    except (OSError, ET.ParseError) as e:
+        print(f"Error setting XFCE icon: {e}")
+        return
     
-    sed_command = (
-        rf"sed -i '/<property name=\"plugin-1\" type=\"string\" value=\"whiskermenu\">/!b;n;c\\ \ \ \ \ \ \ \ \ <property name=\"button-icon\" type=\"string\" value=\"{escaped_icon_path}\"/>' {config_file}"
-    )
+    menu = None
+    for prop in tree.iter('property'):
+        if prop.get('name') == 'plugin-1' and prop.get('value') == 'whiskermenu':
+            menu = prop
+            break
+    if menu is None:
+        print("Error setting XFCE icon: plugin-1 is not the Whisker Menu")
+        return
+    
+    button_icon = menu.find("property[@name='button-icon']")
+    if button_icon is None:
+        button_icon = ET.Element('property', {'name': 'button-icon', 'type': 'string'})
+        menu.insert(0, button_icon)
+    elif button_icon.get('value') == icon_path:
+        # Already set - skip the xfconfd/panel restart
+        return
+    button_icon.set('value', icon_path)
     
     try:
-        subprocess.run(sed_command, shell=True, check=True)
+        tmp = config_file + ".tmp"
+        tree.write(tmp, encoding="UTF-8", xml_declaration=True)
+        os.replace(tmp, config_file)
+        # xfconfd caches channels in memory and has no reload call, so it
+        # must be restarted to pick up the edited file
         subprocess.run(["killall", "xfconfd"], check=False)
         subprocess.run(["xfce4-panel", "-r"], check=True)
         print(f"Set XFCE icon to: {icon_path}")
-    except subprocess.CalledProcessError as e:
+    except (OSError, subprocess.CalledProcessError) as e:
         print(f"Error setting XFCE icon: {e}")
         
-def xfce_set_themes(ws_num: int, config):
+def xfce_set_themes(ws_num: int, snap: dict):
     """
     Set XFCE theme parameters from configuration.
     
     Args:
         ws_num (int): Workspace number (0-based)
-        config: Configuration parser object
+        snap (dict): Config snapshot (see get_config_snapshot)
     """
     section = f"ws{ws_num + 1}"
     
-    if not config.has_section(section):
+    values = snap.get(section)
+    if values is None:
         print(f"No theme config found for {section}")
         return
     
     # Get theme settings with fallbacks
-    icon_theme = config.get(section, 'icon_theme', fallback=None)
-    gtk_theme = config.get(section, 'gtk_theme', fallback=None)
-    cursor_theme = config.get(section, 'cursor_theme', fallback=None)
-    wm_theme = config.get(section, 'wm_theme', fallback=None)
+    icon_theme = values.get('icon_theme')
+    gtk_theme = values.get('gtk_theme')
+    cursor_theme = values.get('cursor_theme')
+    wm_theme = values.get('wm_theme')
     
-    # Apply themes if they exist in config
+    # Apply themes if they exist in config (SetProperty creates missing ones)
     try:
         if icon_theme:
-            # Check if property exists
-            result = subprocess.run(
-                ["xfconf-query", "-c", "xsettings", "-p", "/Net/IconThemeName"],
-                capture_output=True, text=True
-            )
-            if result.returncode == 0:
-                # Property exists - set without --create
-                subprocess.run(
-                    ["xfconf-query", "-c", "xsettings", "-p", "/Net/IconThemeName", "--set", icon_theme],
-                    check=True
-                )
-            else:
-                # Property doesn't exist - create it
-                subprocess.run(
-                    ["xfconf-query", "-c", "xsettings", "-p", "/Net/IconThemeName", "--set", icon_theme, "--create"],
-                    check=True
-                )
+            xfconf_set("xsettings", "/Net/IconThemeName", icon_theme, check=True)
             print(f"✓ XFCE icon theme: {icon_theme}")
         
-        # Repeat the same pattern for other themes...
         if gtk_theme:
-            result = subprocess.run(
-                ["xfconf-query", "-c", "xsettings", "-p", "/Net/ThemeName"],
-                capture_output=True, text=True
-            )
-            if result.returncode == 0:
-                subprocess.run(
-                    ["xfconf-query", "-c", "xsettings", "-p", "/Net/ThemeName", "--set", gtk_theme],
-                    check=True
-                )
-            else:
-                subprocess.run(
-                    ["xfconf-query", "-c", "xsettings", "-p", "/Net/ThemeName", "--set", gtk_theme, "--create"],
-                    check=True
-                )
+            xfconf_set("xsettings", "/Net/ThemeName", gtk_theme, check=True)
             print(f"✓ XFCE GTK theme: {gtk_theme}")
         
         if cursor_theme:
-            result = subprocess.run(
-                ["xfconf-query", "-c", "xsettings", "-p", "/Gtk/CursorThemeName"],
-                capture_output=True, text=True
-            )
-            if result.returncode == 0:
-                subprocess.run(
-                    ["xfconf-query", "-c", "xsettings", "-p", "/Gtk/CursorThemeName", "--set", cursor_theme],
-                    check=True
-                )
-            else:
-                subprocess.run(
-                    ["xfconf-query", "-c", "xsettings", "-p", "/Gtk/CursorThemeName", "--set", cursor_theme, "--create"],
-                    check=True
-                )
+            xfconf_set("xsettings", "/Gtk/CursorThemeName", cursor_theme, check=True)
             print(f"✓ XFCE cursor theme: {cursor_theme}")
         
         if wm_theme:
-            result = subprocess.run(
-                ["xfconf-query", "-c", "xfwm4", "-p", "/general/theme"],
-                capture_output=True, text=True
-            )
-            if result.returncode == 0:
-                subprocess.run(
-                    ["xfconf-query", "-c", "xfwm4", "-p", "/general/theme", "--set", wm_theme],
-                    check=True
-                )
-            else:
-                subprocess.run(
-                    ["xfconf-query", "-c", "xfwm4", "-p", "/general/theme", "--set", wm_theme, "--create"],
-                    check=True
-                )
+            xfconf_set("xfwm4", "/general/theme", wm_theme, check=True)
             print(f"✓ XFCE window theme: {wm_theme}")
         
         print(f"Applied XFCE themes for workspace {ws_num + 1}")
@@ -252,6 +396,94 @@ def xfce_set_themes(ws_num: int, config):
     except subprocess.CalledProcessError as e:
         print(f"Error applying XFCE themes: {e}")
 
+# =============================================================================
+# GSETTINGS HELPERS
+# =============================================================================
+
+# Gio.Settings per schema: {schema: (settings, schema_info) or None}
+_GS_CACHE = {}
+
+def get_settings(schema: str):
+    """
+    Get a cached Gio.Settings for schema.
+    
+    Returns:
+        tuple: (Gio.Settings, Gio.SettingsSchema), or None if Gio is missing
+               or the schema is not installed
+    """
+    if schema not in _GS_CACHE:
+        info = None
+        if HAS_GIO:
+            source = Gio.SettingsSchemaSource.get_default()
+            info = source.lookup(schema, True) if source else None
+        _GS_CACHE[schema] = (Gio.Settings.new(schema), info) if info else None
+    return _GS_CACHE[schema]
+
+def dispatch_glib_events():
+    """
+    Run pending GLib main-context sources without blocking.
+    
+    The cached Gio.Settings objects queue their change notifications on
+    the default main context; the daemon has no GLib main loop, so drain
+    them once per loop iteration to keep them from accumulating.
+    """
+    if HAS_GIO:
+        context = GLib.MainContext.default()
+        while context.iteration(False):
+            pass
+
+def gsettings_set(schema: str, values: dict):
+    """
+    Set string keys of a GSettings schema in one dconf write.
+    
+    Talks to dconf in-process instead of forking `gsettings set` per key;
+    falls back to the gsettings CLI when Gio or the schema is unavailable.
+    
+    Args:
+        schema (str): Schema id (e.g., 'org.gnome.desktop.background')
+        values (dict): Key -> string value
+    """
+    cached = get_settings(schema)
+    if cached is None:
+        for key, value in values.items():
+            subprocess.run(["gsettings", "set", schema, key, value])
+        return
+    
+    settings, info = cached
+    settings.delay()
+    for key, value in values.items():
+        # Setting an unknown key aborts the process, so skip it like the
+        # gsettings CLI would (e.g. picture-uri-dark before GNOME 42)
+        if not info.has_key(key):
+            continue
+        if not settings.set_string(key, value):
+            print(f"[AWP] Invalid value for {schema} {key}: {value}")
+    settings.apply()
+    Gio.Settings.sync()
+
+def gsettings_set_themes(values: dict, table: tuple):
+    """
+    Apply configured themes through a (config key -> GSettings key) table.
+    
+    Keys that share a schema are written together in one gsettings_set().
+    
+    Args:
+        values (dict): Workspace section from the config snapshot
+        table (tuple): (config key, schema, gsettings key, label or None)
+    """
+    by_schema = {}
+    applied = []
+    for cfg_key, schema, key, label in table:
+        value = values.get(cfg_key)
+        if value:
+            by_schema.setdefault(schema, {})[key] = value
+            if label:
+                applied.append(f"✓ {label}: {value}")
+    for schema, keys in by_schema.items():
+        gsettings_set(schema, keys)
+    for line in applied:
+        print(line)
+
 # =============================================================================
 # GNOME BACKEND FUNCTIONS
 # =============================================================================
@@ -264,29 +496,24 @@ def gnome_set_wallpaper(ws_num: int, image_path: str, scaling: str):
     """Set wallpaper for GNOME with specified scaling."""
     uri = f"file://{image_path}"
     style_val = SCALING_GNOME.get(scaling, 'zoom')
-    subprocess.run(["gsettings", "set", "org.gnome.desktop.background", "picture-uri", uri])
-    subprocess.run(["gsettings", "set", "org.gnome.desktop.background", "picture-uri-dark", uri])
-    subprocess.run(["gsettings", "set", "org.gnome.desktop.background", "picture-options", style_val])
-
-def gnome_set_themes(ws_num: int, config):
+    gsettings_set("org.gnome.desktop.background", {
+        "picture-uri": uri,
+        "picture-uri-dark": uri,
+        "picture-options": style_val,
+    })
+
+GNOME_THEME_KEYS = (
+    ('icon_theme', 'org.gnome.desktop.interface', 'icon-theme', 'GNOME icon theme'),
+    ('gtk_theme', 'org.gnome.desktop.interface', 'gtk-theme', 'GNOME GTK theme'),
+    ('cursor_theme', 'org.gnome.desktop.interface', 'cursor-theme', 'GNOME cursor theme'),
+)
+
+def gnome_set_themes(ws_num: int, snap: dict):
     """Set GNOME theme parameters from configuration."""
-    section = f"ws{ws_num + 1}"
-    if not config.has_section(section):
+    values = snap.get(f"ws{ws_num + 1}")
+    if values is None:
         return
-    
-    icon_theme = config.get(section, 'icon_theme', fallback=None)
-    gtk_theme = config.get(section, 'gtk_theme', fallback=None)
-    cursor_theme = config.get(section, 'cursor_theme', fallback=None)
-    
-    if icon_theme:
-        subprocess.run(["gsettings", "set", "org.gnome.desktop.interface", "icon-theme", icon_theme])
-        print(f"✓ GNOME icon theme: {icon_theme}")
-    if gtk_theme:
-        subprocess.run(["gsettings", "set", "org.gnome.desktop.interface", "gtk-theme", gtk_theme])
-        print(f"✓ GNOME GTK theme: {gtk_theme}")
-    if cursor_theme:
-        subprocess.run(["gsettings", "set", "org.gnome.desktop.interface", "cursor-theme", cursor_theme])
-        print(f"✓ GNOME cursor theme: {cursor_theme}")
+    gsettings_set_themes(values, GNOME_THEME_KEYS)
 
 # =============================================================================
 # CINNAMON BACKEND FUNCTIONS
@@ -300,8 +527,10 @@ def cinnamon_set_wallpaper(ws_num: int, image_path: str, scaling: str):
     """Set wallpaper for Cinnamon with specified scaling."""
     uri = f"file://{image_path}"
     style_val = SCALING_CINNAMON.get(scaling, 'zoom')
-    subprocess.run(["gsettings", "set", "org.cinnamon.desktop.background", "picture-uri", uri])
-    subprocess.run(["gsettings", "set", "org.cinnamon.desktop.background", "picture-options", style_val])
+    gsettings_set("org.cinnamon.desktop.background", {
+        "picture-uri": uri,
+        "picture-options": style_val,
+    })
 
 def cinnamon_set_icon(icon_path: str):
     """
@@ -331,48 +560,30 @@ def cinnamon_set_icon(icon_path: str):
     except Exception as e:
         print(f"Error setting Cinnamon menu icon: {e}")
 
-def cinnamon_set_themes(ws_num: int, config):
+CINNAMON_THEME_KEYS = (
+    ('icon_theme', 'org.cinnamon.desktop.interface', 'icon-theme', 'Cinnamon icon theme'),
+    ('gtk_theme', 'org.cinnamon.desktop.interface', 'gtk-theme', 'Cinnamon GTK theme'),
+    ('cursor_theme', 'org.cinnamon.desktop.interface', 'cursor-theme', 'Cinnamon cursor theme'),
+    ('desktop_theme', 'org.cinnamon.theme', 'name', 'Cinnamon desktop theme'),
+    ('wm_theme', 'org.cinnamon.desktop.wm.preferences', 'theme', 'Cinnamon window theme'),
+)
+
+def cinnamon_set_themes(ws_num: int, snap: dict):
     """
     Set Cinnamon theme parameters from configuration.
     
     Args:
         ws_num (int): Workspace number (0-based)
-        config: Configuration parser object
+        snap (dict): Config snapshot (see get_config_snapshot)
     """
     section = f"ws{ws_num + 1}"
     
-    if not config.has_section(section):
+    values = snap.get(section)
+    if values is None:
         print(f"No theme config found for {section}")
         return
     
-    # Get theme settings with fallbacks
-    icon_theme = config.get(section, 'icon_theme', fallback=None)
-    gtk_theme = config.get(section, 'gtk_theme', fallback=None)
-    cursor_theme = config.get(section, 'cursor_theme', fallback=None)
-    desktop_theme = config.get(section, 'desktop_theme', fallback=None)
-    wm_theme = config.get(section, 'wm_theme', fallback=None)
-    
-    # Apply themes if they exist in config
-    if icon_theme:
-        subprocess.run(["gsettings", "set", "org.cinnamon.desktop.interface", "icon-theme", icon_theme])
-        print(f"✓ Cinnamon icon theme: {icon_theme}")
-    
-    if gtk_theme:
-        subprocess.run(["gsettings", "set", "org.cinnamon.desktop.interface", "gtk-theme", gtk_theme])
-        print(f"✓ Cinnamon GTK theme: {gtk_theme}")
-    
-    if cursor_theme:
-        subprocess.run(["gsettings", "set", "org.cinnamon.desktop.interface", "cursor-theme", cursor_theme])
-        print(f"✓ Cinnamon cursor theme: {cursor_theme}")
-    
-    if desktop_theme:
-        subprocess.run(["gsettings", "set", "org.cinnamon.theme", "name", desktop_theme])
-        print(f"✓ Cinnamon desktop theme: {desktop_theme}")
-    
-    if wm_theme:
-        subprocess.run(["gsettings", "set", "org.cinnamon.desktop.wm.preferences", "theme", wm_theme])
-        print(f"✓ Cinnamon window theme: {wm_theme}")
-    
+    gsettings_set_themes(values, CINNAMON_THEME_KEYS)
     print(f"Applied Cinnamon themes for workspace {ws_num + 1}")
 
 # =============================================================================
@@ -386,28 +597,24 @@ def mate_force_single_workspace_off():
 def mate_set_wallpaper(ws_num: int, image_path: str, scaling: str):
     """Set wallpaper for MATE with specified scaling."""
     style_val = SCALING_MATE.get(scaling, 'zoom')
-    subprocess.run(["gsettings", "set", "org.mate.background", "picture-filename", image_path])
-    subprocess.run(["gsettings", "set", "org.mate.background", "picture-options", style_val])
-
-def mate_set_themes(ws_num: int, config):
+    gsettings_set("org.mate.background", {
+        "picture-filename": image_path,
+        "picture-options": style_val,
+    })
+
+MATE_THEME_KEYS = (
+    ('icon_theme', 'org.mate.interface', 'icon-theme', None),
+    ('gtk_theme', 'org.mate.interface', 'gtk-theme', None),
+    ('cursor_theme', 'org.mate.peripherals-mouse', 'cursor-theme', None),
+    ('wm_theme', 'org.mate.Marco.general', 'theme', None),
+)
+
+def mate_set_themes(ws_num: int, snap: dict):
     """Set MATE theme parameters from configuration."""
-    section = f"ws{ws_num + 1}"
-    if not config.has_section(section):
+    values = snap.get(f"ws{ws_num + 1}")
+    if values is None:
         return
-    
-    icon_theme = config.get(section, 'icon_theme', fallback=None)
-    gtk_theme = config.get(section, 'gtk_theme', fallback=None)
-    cursor_theme = config.get(section, 'cursor_theme', fallback=None)
-    wm_theme = config.get(section, 'wm_theme', fallback=None)
-    
-    if icon_theme:
-        subprocess.run(["gsettings", "set", "org.mate.interface", "icon-theme", icon_theme])
-    if gtk_theme:
-        subprocess.run(["gsettings", "set", "org.mate.interface", "gtk-theme", gtk_theme])
-    if cursor_theme:
-        subprocess.run(["gsettings", "set", "org.mate.peripherals-mouse", "cursor-theme", cursor_theme])
-    if wm_theme:
-        subprocess.run(["gsettings", "set", "org.mate.Marco.general", "theme", wm_theme])
+    gsettings_set_themes(values, MATE_THEME_KEYS)
 
 # =============================================================================
 # GENERIC/OPENBOX BACKEND FUNCTIONS
@@ -428,14 +635,15 @@ def openbox_set_wallpaper(ws_num: int, image_path: str, scaling: str):
     style_val = scaling_options.get(scaling, '--bg-fill')
     subprocess.run(["feh", style_val, image_path])
 
-def openbox_set_themes(ws_num: int, config):
+def openbox_set_themes(ws_num: int, snap: dict):
     """Generic/Openbox theme setting - limited support."""
     section = f"ws{ws_num + 1}"
-    if not config.has_section(section):
+    values = snap.get(section)
+    if values is None:
         return
     
     # Generic WMs typically only support basic GTK themes
-    gtk_theme = config.get(section, 'gtk_theme', fallback=None)
+    gtk_theme = values.get('gtk_theme')
     if gtk_theme:
         print(f"Note: Generic WM - GTK theme would be: {gtk_theme}")
 
@@ -480,29 +688,24 @@ backend_funcs = {
 # UNIVERSAL DESKTOP FUNCTIONS
 # =============================================================================
 
-def force_single_workspace_off():
-    """Disable single workspace mode for current desktop environment."""
-    func = backend_funcs.get(DE, {}).get("workspace_off")
-    if func:
-        func()
-
-def set_wallpaper(ws_num: int, image_path: str, scaling: str):
-    """Set wallpaper for specified workspace with given scaling."""
-    func = backend_funcs.get(DE, {}).get("wallpaper")
-    if func:
-        func(ws_num, image_path, scaling)
-
-def set_panel_icon(icon_path: str):
-    """Set panel/menu icon for current desktop environment."""
-    func = backend_funcs.get(DE, {}).get("icon")
-    if func:
-        func(icon_path)
-
-def set_themes(ws_num: int, config):
-    """Apply theme settings for specified workspace."""
-    func = backend_funcs.get(DE, {}).get("themes")
-    if func:
-        func(ws_num, config)
+def _backend_noop(*_args):
+    """Stand-in for backend functions the current DE doesn't implement."""
+
+# Entry points for the current DE; bound by resolve_backend() once DE is known:
+#   force_single_workspace_off()
+#   set_wallpaper(ws_num, image_path, scaling)
+#   set_panel_icon(icon_path)
+#   set_themes(ws_num, snap)
+force_single_workspace_off = set_wallpaper = set_panel_icon = set_themes = _backend_noop
+
+def resolve_backend():
+    """Bind the universal entry points to the backend functions for DE."""
+    global force_single_workspace_off, set_wallpaper, set_panel_icon, set_themes
+    funcs = backend_funcs.get(DE, {})
+    force_single_workspace_off = funcs.get("workspace_off") or _backend_noop
+    set_wallpaper = funcs.get("wallpaper") or _backend_noop
+    set_panel_icon = funcs.get("icon") or _backend_noop
+    set_themes = funcs.get("themes") or _backend_noop
 
 def configure_screen_blanking():
     """
@@ -522,50 +725,237 @@ def configure_screen_blanking():
 # CONKY INTEGRATION
 # =============================================================================
 
-def update_conky_state(workspace_name: str, wallpaper_path: str):
+def update_conky_state(workspace_name: str, wallpaper_path: str, snap=None):
     """
     Update Conky state file with current workspace and wallpaper information.
     
+    The file is replaced atomically and only when its contents change, so
+    Conky is not woken up for identical state.
+    
     Args:
         workspace_name (str): Current workspace name (e.g., 'ws1')
         wallpaper_path (str): Path to current wallpaper image
+        snap (dict): Config snapshot (defaults to get_config_snapshot())
     """
-    config = configparser.ConfigParser()
-    config.read(CONFIG_PATH)
-    icon_path = config.get(workspace_name, 'icon', fallback='')
-    color_hex = config.get(workspace_name, 'icon_color', fallback='#109daf')
-    intv_val = config.get(workspace_name, 'timing', fallback='10s')
-    flow_val = config.get(workspace_name, 'mode', fallback='random')
-    sort_val = config.get(workspace_name, 'order', fallback='n')
-    view_val = config.get(workspace_name, 'scaling', fallback='scaled')
-    with open(CONKY_STATE_PATH, 'w') as f:
-        f.write(f"wallpaper_path={wallpaper_path}\n")
-        f.write(f"workspace_name={workspace_name}\n")
-        f.write(f"logo_path={icon_path}\n")
-        f.write(f"icon_color={color_hex}\n")
-        f.write(f"intv={intv_val}\n")
-        f.write(f"flow={flow_val}\n")
-        f.write(f"sort={sort_val}\n")
-        f.write(f"view={view_val}\n")
-        f.write(f"blanking_timeout={BLANKING_FORMATTED}\n")
-        f.write(f"blanking_paused={str(BLANKING_PAUSE)}\n")
+    global _LAST_CONKY_PAYLOAD
+    if snap is None:
+        snap = get_config_snapshot()
+    values = snap.get(workspace_name, {})
+    items = (
+        ("wallpaper_path", wallpaper_path),
+        ("workspace_name", workspace_name),
+        ("logo_path", values.get('icon', '')),
+        ("icon_color", values.get('icon_color', '#109daf')),
+        ("intv", values.get('timing', '10s')),
+        ("flow", values.get('mode', 'random')),
+        ("sort", values.get('order', 'n')),
+        ("view", values.get('scaling', 'scaled')),
+        ("blanking_timeout", BLANKING_FORMATTED),
+        ("blanking_paused", str(BLANKING_PAUSE)),
+    )
+    payload = ("\n".join(f"{k}={v}" for k, v in items) + "\n").encode("utf-8")
+    if payload == _LAST_CONKY_PAYLOAD:
+        return
+    tmp = CONKY_STATE_PATH + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+    os.replace(tmp, CONKY_STATE_PATH)
+    _LAST_CONKY_PAYLOAD = payload
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+def get_config_cached() -> configparser.ConfigParser:
+    """
+    Return the parsed config, re-reading the file only when it has changed.
+
+    The INI only changes when the user saves from the dashboard, so the
+    parsed ConfigParser is kept in memory and reused as long as the file's
+    mtime matches the one it was parsed at.
+
+    Returns:
+        configparser.ConfigParser: Parsed configuration (empty if missing)
+    """
+    try:
+        mtime = os.stat(CONFIG_PATH).st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime is not None and mtime == _CONFIG_CACHE["mtime"]:
+        return _CONFIG_CACHE["config"]
+    # The config has no %(...)s references, so skip interpolation on get()
+    config = configparser.ConfigParser(interpolation=None)
+    config.read(CONFIG_PATH)
+    _CONFIG_CACHE["mtime"] = mtime
+    _CONFIG_CACHE["config"] = config
+    _CONFIG_CACHE["snapshot"] = None
+    return config
+
+def get_config_snapshot() -> dict:
+    """
+    Return the cached config flattened to plain dicts.
+    
+    Backends and the Conky writer only read string values, which is cheaper
+    from a dict than through ConfigParser's section proxies. The snapshot
+    is rebuilt whenever get_config_cached() reparses the file.
+    
+    Returns:
+        dict: {section: {key: value}}
+    """
+    config = get_config_cached()
+    if _CONFIG_CACHE["snapshot"] is None:
+        _CONFIG_CACHE["snapshot"] = {
+            sec: dict(config.items(sec, raw=True)) for sec in config.sections()
+        }
+    return _CONFIG_CACHE["snapshot"]
+
+_TIMING_UNITS = {'s': 1, 'm': 60, 'h': 3600}
+
+@functools.lru_cache(maxsize=32)
 def parse_timing(timing_str: str) -> int:
-    """Convert timing string (e.g., 30s, 7m, 2h) to seconds."""
-    units = {'s': 1, 'm': 60, 'h': 3600}
+    """Convert timing string (e.g., 30s, 7m, 2h) to seconds (None if invalid)."""
+    if not isinstance(timing_str, str) or len(timing_str) < 2:
+        return None
+    number = timing_str[:-1]
+    # isdecimal(), not isdigit(): int() rejects digits like '²'
+    if not number.isdecimal():
+        return None
+    return int(number) * _TIMING_UNITS.get(timing_str[-1].lower(), 60)
+
+def get_monitor_topology() -> str:
+    """Get current monitor layout from xrandr, or '' if unavailable."""
     try:
-        unit = timing_str[-1].lower()
-        number = int(timing_str[:-1])
-        return number * units.get(unit, 60)
-    except Exception:
+        return subprocess.check_output(
+            ["xrandr", "--listmonitors"], text=True, stderr=subprocess.DEVNULL
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+def invalidate_monitor_cache(*_args):
+    """Forget cached monitor lists (also used as the SIGUSR1 handler)."""
+    xfce_get_all_monitors.cache_clear()
+
+def request_reload(*_args):
+    """
+    SIGHUP handler: drop all caches and re-apply the current workspace.
+    
+    The signal also wakes wait_for_workspace_change() through the wakeup
+    pipe, so the reload happens immediately rather than on the next tick.
+    """
+    global _RELOAD_REQUESTED
+    _CONFIG_CACHE["mtime"] = None
+    _STATE_CACHE["key"] = None
+    _IMG_CACHE.clear()
+    _XFCE_APPLIED.clear()
+    invalidate_monitor_cache()
+    _RELOAD_REQUESTED = True
+
+def setup_signal_wakeup():
+    """Install signal handlers and route their wakeups into a pipe."""
+    global _WAKEUP_FD
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    os.set_blocking(write_fd, False)
+    signal.set_wakeup_fd(write_fd)
+    _WAKEUP_FD = read_fd
+    # `kill -USR1 <pid>` drops cached monitor lists after a display change,
+    # `kill -HUP <pid>` reloads config, folders and monitors right away
+    signal.signal(signal.SIGUSR1, invalidate_monitor_cache)
+    signal.signal(signal.SIGHUP, request_reload)
+
+@functools.lru_cache(maxsize=None)
+def get_x_connection():
+    """
+    Open the daemon's X connection once.
+    
+    Returns:
+        tuple: (display, root window, _NET_CURRENT_DESKTOP atom, RandR
+               ScreenChangeNotify event code or None), or None if
+               python-xlib is missing or no X display is reachable
+    """
+    if not HAS_XLIB:
+        return None
+    try:
+        disp = xdisplay.Display()
+    except Exception as e:
+        print(f"[AWP] X connection unavailable, using xprop: {e}")
         return None
+    root = disp.screen().root
+    # Get PropertyNotify events for the root window so the main loop can
+    # sleep until the workspace changes instead of polling
+    root.change_attributes(event_mask=X.PropertyChangeMask)
+    # Monitor hotplug/resolution changes invalidate the monitor cache
+    screen_change = None
+    if disp.has_extension('RANDR'):
+        root.xrandr_select_input(randr.RRScreenChangeNotifyMask)
+        screen_change = disp.extension_event.ScreenChangeNotify
+    disp.flush()
+    return disp, root, disp.intern_atom('_NET_CURRENT_DESKTOP'), screen_change
+
+def has_randr_events() -> bool:
+    """Whether monitor changes arrive as RandR events (no xrandr polling)."""
+    conn = get_x_connection()
+    return conn is not None and conn[3] is not None
+
+def wait_for_workspace_change(deadline: float):
+    """
+    Block until the current workspace changes, a signal arrives or the
+    deadline passes.
+    
+    Without an X connection this falls back to the old 0.5s poll.
+    
+    Args:
+        deadline (float): time.time() value to return at the latest
+    """
+    wake = [_WAKEUP_FD] if _WAKEUP_FD is not None else []
+    conn = get_x_connection()
+    if conn is None:
+        timeout = max(0.0, min(0.5, deadline - time.time()))
+        if select.select(wake, [], [], timeout)[0]:
+            drain_wakeup_fd()
+        return
+    disp, _root, atom, screen_change = conn
+    while True:
+        # Drain queued events; other root properties (active window, etc.)
+        # change often and must not wake the loop
+        while disp.pending_events():
+            ev = disp.next_event()
+            if ev.type == X.PropertyNotify and ev.atom == atom:
+                return
+            if screen_change is not None and ev.type == screen_change:
+                invalidate_monitor_cache()
+        timeout = deadline - time.time()
+        if timeout <= 0:
+            return
+        if timeout == float('inf'):
+            timeout = None  # Nothing scheduled; wait for an event
+        ready = select.select([disp.fileno()] + wake, [], [], timeout)[0]
+        if _WAKEUP_FD is not None and _WAKEUP_FD in ready:
+            drain_wakeup_fd()
+            return
+
+def drain_wakeup_fd():
+    """Empty the signal wakeup pipe."""
+    try:
+        while os.read(_WAKEUP_FD, 512):
+            pass
+    except BlockingIOError:
+        pass
 
 def get_current_workspace() -> int:
-    """Get current workspace number using xprop."""
+    """Get current workspace number from the root window (xprop fallback)."""
+    conn = get_x_connection()
+    if conn is not None:
+        _disp, root, atom, _screen_change = conn
+        try:
+            prop = root.get_full_property(atom, X.AnyPropertyType)
+            if prop is not None and len(prop.value):
+                return int(prop.value[0])
+        except xerror.XError:
+            pass
     ws_num = subprocess.check_output(
         ["xprop", "-root", "_NET_CURRENT_DESKTOP"], text=True
     ).strip().split()[-1]
@@ -577,21 +967,46 @@ def ensure_awp_dir():
         os.makedirs(AWP_DIR, exist_ok=True)
 
 def load_state() -> dict:
-    """Load workspace state from JSON file."""
-    if not os.path.isfile(STATE_PATH):
-        return {}
+    """
+    Load workspace state from JSON file.
+    
+    The parsed state is kept in memory and re-read only when the file
+    changes on disk, so indexes written by awp_nav are still picked up.
+    
+    Returns:
+        dict: Copy of the workspace state ({} if missing or unreadable)
+    """
     try:
-        with open(STATE_PATH, "r") as f:
-            return json.load(f)
-    except Exception:
+        st = os.stat(STATE_PATH)
+    except OSError:
         return {}
+    # Both writers replace the file, so the inode changes on every save
+    # even if two land within one mtime tick
+    key = (st.st_mtime_ns, st.st_ino)
+    if key != _STATE_CACHE["key"]:
+        try:
+            with open(STATE_PATH, "rb") as f:
+                data = f.read()
+            state = orjson.loads(data) if HAS_ORJSON else json.loads(data)
+        except Exception:
+            return {}
+        _STATE_CACHE["key"] = key
+        _STATE_CACHE["state"] = state
+    return dict(_STATE_CACHE["state"])
 
 def save_state(state: dict):
-    """Save workspace state to JSON file."""
+    """Save workspace state to JSON file (and the in-memory copy)."""
     tmp = STATE_PATH + ".tmp"
-    with open(tmp, "w") as f:
-        json.dump(state, f)
+    payload = orjson.dumps(state) if HAS_ORJSON else json.dumps(state).encode()
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+        st = os.fstat(fd)
+    finally:
+        os.close(fd)
     os.replace(tmp, STATE_PATH)
+    _STATE_CACHE["key"] = (st.st_mtime_ns, st.st_ino)
+    _STATE_CACHE["state"] = dict(state)
 
 def get_ws_key(ws_num: int) -> str:
     """Get workspace key for state storage."""
@@ -600,11 +1015,13 @@ def get_ws_key(ws_num: int) -> str:
 def load_config():
     """Load and parse configuration file."""
     global DE, SESSION_TYPE, BLANKING_PAUSE, BLANKING_TIMEOUT, BLANKING_FORMATTED
-    config = configparser.ConfigParser()
+    global _LOADED_CONFIG
     if not os.path.isfile(CONFIG_PATH):
         print(f"Config file {CONFIG_PATH} not found. Run awp_setup.py first.")
         sys.exit(1)
-    config.read(CONFIG_PATH)
+    config = get_config_cached()
+    if config is _LOADED_CONFIG:
+        return config  # Unchanged since the globals were last set
     
     # Load DE from config, with fallback to runtime detection
     valid_des = ["xfce", "gnome", "cinnamon", "mate", "generic"]
@@ -614,6 +1031,8 @@ def load_config():
         de = os.environ.get("XDG_CURRENT_DESKTOP", "").lower()
         DE = next((de_type for de_type in valid_des if de_type in de), "unknown")
     
+    resolve_backend()
+    
     # Load SESSION_TYPE from config
     SESSION_TYPE = config.get('general', 'session_type', fallback='x11')
     
@@ -637,26 +1056,62 @@ def load_config():
             BLANKING_FORMATTED = f"{hours}h{minutes}m" if minutes > 0 else f"{hours}h"
         print(f"[AWP] Blanking formatted: {BLANKING_FORMATTED}")
     
+    _LOADED_CONFIG = config
     return config
 
 def load_images(folder_path: str) -> list:
-    """Load all JPEG and PNG images from specified folder."""
-    p = Path(folder_path)
-    if not p.is_dir():
+    """
+    Load all JPEG and PNG images from specified folder.
+    
+    The listing is cached per folder and only rescanned when the folder's
+    mtime changes (i.e. files were added, removed or renamed).
+    
+    Args:
+        folder_path (str): Wallpaper folder to scan
+        
+    Returns:
+        list: Image paths as Path objects
+    """
+    try:
+        mtime = os.stat(folder_path).st_mtime_ns
+    except (OSError, TypeError):
         return []
-    return list(p.glob("*.[jJ][pP][gG]")) + list(p.glob("*.[pP][nN][gG]"))
+    hit = _IMG_CACHE.get(folder_path)
+    if hit and hit[0] == mtime:
+        return list(hit[1])
+    try:
+        # Same extensions as awp_nav so both see the same index order
+        with os.scandir(folder_path) as it:
+            images = [Path(e.path) for e in it
+                      if e.name.lower().endswith(('.jpg', '.png')) and e.is_file()]
+    except OSError:
+        return []
+    _IMG_CACHE[folder_path] = (mtime, images)
+    return list(images)
+
+def _image_name_key(f: Path) -> str:
+    """Sort key: case-insensitive file name."""
+    return f.name.lower()
+
+def _image_mtime_key(f: Path) -> float:
+    """Sort key: modification time."""
+    return f.stat().st_mtime
+
+# order key -> (sort key function, reverse)
+IMAGE_ORDERS = {
+    'name_az': (_image_name_key, False),
+    'name_za': (_image_name_key, True),
+    'name_new': (_image_mtime_key, True),
+    'name_old': (_image_mtime_key, False),
+}
 
 def sort_images(images: list, order_key: str) -> list:
     """Sort images based on specified order preference."""
-    if order_key == 'name_az':
-        return sorted(images, key=lambda f: f.name.lower())
-    elif order_key == 'name_za':
-        return sorted(images, key=lambda f: f.name.lower(), reverse=True)
-    elif order_key == 'name_new':
-        return sorted(images, key=lambda f: f.stat().st_mtime, reverse=True)
-    elif order_key == 'name_old':
-        return sorted(images, key=lambda f: f.stat().st_mtime)
-    return images
+    order = IMAGE_ORDERS.get(order_key)
+    if order is None:
+        return images
+    key_func, reverse = order
+    return sorted(images, key=key_func, reverse=reverse)
 
 # =============================================================================
 # WORKSPACE MODEL
@@ -688,28 +1143,49 @@ class Workspace:
         self.images = []
         self.index = 0
         self.next_switch_time = time.time() + self.timing
+        self._images_key = None
+        self._config_seen = None
         self.reload_images_and_index()
 
-    def reload_images_and_index(self):
-        """Reload images and configuration from disk."""
-        # Reload all config fields
-        config = configparser.ConfigParser()
-        config.read(CONFIG_PATH)
-        section = f"ws{self.num+1}"
-        if section in config:
-            self.folder = config[section].get('folder', self.folder)
-            self.timing_str = config[section].get('timing', '1m')
-            self.timing = parse_timing(self.timing_str) or 60
-            self.mode = config[section].get('mode', 'random')
-            self.order = config[section].get('order', 'name_az')
-            self.scaling = config[section].get('scaling', 'scaled')
-
-        # Reload images and index
-        self.images = load_images(self.folder)
-        if self.mode == 'sequential':
-            self.images = sort_images(self.images, self.order)
-        else:
-            self.images = sort_images(self.images, 'name_az')
+    def invalidate_cache(self):
+        """Force the next reload to rescan and re-sort the folder."""
+        self._images_key = None
+
+    def reload_images_and_index(self, snap=None):
+        """
+        Reload images and configuration from disk.
+        
+        Args:
+            snap (dict): Config snapshot already fetched by the caller
+                         (defaults to get_config_snapshot())
+        """
+        # Reload all config fields, only if the file changed since last time
+        if snap is None:
+            snap = get_config_snapshot()
+        if snap is not self._config_seen:
+            self._config_seen = snap
+            values = snap.get(self.key)
+            if values is not None:
+                self.folder = values.get('folder', self.folder)
+                self.timing_str = values.get('timing', '1m')
+                self.timing = parse_timing(self.timing_str) or 60
+                self.mode = values.get('mode', 'random')
+                self.order = values.get('order', 'name_az')
+                self.scaling = values.get('scaling', 'scaled')
+
+        # Reload images and index; the sorted list is reused while the
+        # folder and sort order are unchanged
+        order_key = self.order if self.mode == 'sequential' else 'name_az'
+        try:
+            folder_mtime = os.stat(self.folder).st_mtime_ns
+        except (OSError, TypeError):
+            folder_mtime = None
+        images_key = (self.folder, folder_mtime, order_key)
+        # By-date orders depend on the files' own mtimes, which can change
+        # without touching the folder, so those are always re-sorted
+        if images_key != self._images_key or order_key in ('name_new', 'name_old'):
+            self.images = sort_images(load_images(self.folder), order_key)
+            self._images_key = images_key
 
         state = load_state()
         self.index = int(state.get(self.key, 0) or 0)
@@ -723,10 +1199,9 @@ class Workspace:
         if self.mode == 'random':
             if len(self.images) == 1:
                 return 0
-            new_idx = self.index
-            while new_idx == self.index:
-                new_idx = random.randint(0, len(self.images)-1)
-            return new_idx
+            # Draw from the other N-1 images and step over the current one
+            r = random.randrange(len(self.images) - 1)
+            return r if r < self.index else r + 1
         return (self.index + 1) % len(self.images)
 
     def apply_index(self, new_index: int):
@@ -751,31 +1226,56 @@ class Workspace:
 
 def main_loop(workspaces: dict):
     """Main daemon loop managing workspace wallpaper rotation."""
+    global _RELOAD_REQUESTED
     last_ws = None
+    # With RandR events the monitor cache is invalidated by the X event
+    # handling in wait_for_workspace_change(); otherwise poll xrandr
+    if has_randr_events():
+        topology, next_topology_check = None, float('inf')
+    else:
+        topology, next_topology_check = get_monitor_topology(), time.time() + 60
     while True:
         now = time.time()
+
+        # SIGHUP: re-apply the current workspace from freshly read config
+        if _RELOAD_REQUESTED:
+            _RELOAD_REQUESTED = False
+            for w in workspaces.values():
+                w.invalidate_cache()
+            last_ws = None
+
+        # Re-read monitor layout once a minute; a change invalidates the
+        # cached per-workspace monitor lists
+        if now >= next_topology_check:
+            new_topology = get_monitor_topology()
+            if new_topology != topology:
+                topology = new_topology
+                invalidate_monitor_cache()
+            next_topology_check = now + 60
+
         ws_num = get_current_workspace()
         ws = workspaces.get(ws_num)
         if not ws:
-            time.sleep(0.5)
+            dispatch_glib_events()
+            wait_for_workspace_change(next_topology_check)
             continue
 
         force_single_workspace_off()
 
         if ws_num != last_ws:
-            ws.reload_images_and_index()
+            # One config lookup shared by the reload, icon and themes
+            load_config()
+            snap = get_config_snapshot()
+            ws.reload_images_and_index(snap)
             ws.apply_index(ws.index)
             ws.next_switch_time = now + ws.timing
             
-            config = load_config()
-            ws_key = get_ws_key(ws_num)
-            if ws_key in config:
-                icon_path = config[ws_key].get('icon', '')
-                if icon_path:
-                    set_panel_icon(icon_path)
+            icon_path = snap.get(get_ws_key(ws_num), {}).get('icon', '')
+            if icon_path:
+                set_panel_icon(icon_path)
             
             # Apply theme changes on workspace switch
-            set_themes(ws_num, config)
+            set_themes(ws_num, snap)
             
             last_ws = ws_num
 
@@ -787,13 +1287,17 @@ def main_loop(workspaces: dict):
                 print(f"[{datetime.now().strftime('%H:%M:%S')}] WS{ws.num+1}: index -> {ws.index}")
             ws.next_switch_time = now + ws.timing
 
-        time.sleep(0.5)
+        flush_desktop_reload()
+        dispatch_glib_events()
+        wait_for_workspace_change(min(ws.next_switch_time, next_topology_check))
 
 def main():
     """Main daemon entry point."""
     ensure_awp_dir()
     config = load_config()
 
+    setup_signal_wakeup()
+
     # Configure screen blanking based on INI settings
     configure_screen_blanking()
     force_single_workspace_off()
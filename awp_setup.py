@@ -15,22 +15,34 @@ Features:
 """
 
 import configparser
+import functools
+import importlib.util
+import io
 import os
+import re
 import subprocess
 import sys
 import shutil
 from PIL import Image
 import textwrap
+import types
+
+try:
+    from gi.repository import Gio, GLib
+    HAS_GIO = True
+except ImportError:
+    HAS_GIO = False
 
 # =============================================================================
 # PATHS AND CONSTANTS
 # =============================================================================
-AWP_DIR = os.path.expanduser("~/awp")
+USER_HOME = os.path.expanduser("~")
+AWP_DIR = os.path.join(USER_HOME, "awp")
 CONFIG_PATH = os.path.join(AWP_DIR, "awp_config.ini")
 BACKUP_PATH = os.path.join(AWP_DIR, "awp_config.ini.bak")
-BASE_FOLDER = os.path.expanduser("~")
+BASE_FOLDER = USER_HOME
 ICON_DIR = os.path.join(AWP_DIR, "logos")
-USER_HOME = os.path.expanduser("~")
+AUTOSTART_DIR = os.path.join(USER_HOME, ".config", "autostart")
 
 # =============================================================================
 # CONFIGURATION MAPPINGS
@@ -45,6 +57,12 @@ SCALING_MAP = {
 MODE_MAP = {
     'r': 'random', 's': 'sequential'
 }
+# DE -> (GSettings schema holding num-workspaces, display name)
+WM_WORKSPACE_SCHEMAS = {
+    'gnome': ('org.gnome.desktop.wm.preferences', 'GNOME'),
+    'mate': ('org.mate.Marco.general', 'MATE'),
+    'cinnamon': ('org.cinnamon.desktop.wm.preferences', 'Cinnamon'),
+}
 
 def print_header(text: str):
     """Print a formatted section header."""
@@ -68,26 +86,126 @@ def wrap_text(text: str, width: int = 70) -> str:
     """Wrap text to specified width for better readability."""
     return '\n'.join(textwrap.wrap(text, width=width))
 
-def run_shell(cmd: str, error_msg: str = "Command failed") -> str:
+def run_shell(argv: list, error_msg: str = "Command failed") -> str:
     """
-    Run shell command with proper error handling.
+    Run a command (without a shell) with proper error handling.
     
     Args:
-        cmd (str): Command to execute
+        argv (list): Program and arguments to execute
         error_msg (str): Custom error message
         
     Returns:
         str: Command output or None if failed
     """
     try:
-        result = subprocess.run(
-            cmd, shell=True, capture_output=True, text=True, check=True
+        result = subprocess.run(argv, capture_output=True, text=True)
+    except OSError as e:
+        print_warning(f"{error_msg}: {e}")
+        return None
+    
+    if result.returncode != 0:
+        print_warning(f"{error_msg}: {result.stderr.strip()}")
+        return None
+    return result.stdout.strip()
+
+def get_settings(schema: str, key: str):
+    """
+    Get a Gio.Settings for schema if it is installed and has key.
+    
+    Returns:
+        Gio.Settings: Settings object, or None if Gio, the schema or the key
+                      is unavailable (callers then fall back to gsettings)
+    """
+    if not HAS_GIO:
+        return None
+    source = Gio.SettingsSchemaSource.get_default()
+    info = source.lookup(schema, True) if source else None
+    if info is None or not info.has_key(key):
+        return None
+    return Gio.Settings.new(schema)
+
+def gsettings_get_int(schema: str, key: str, error_msg: str) -> int:
+    """
+    Read an integer GSettings key in-process, falling back to gsettings.
+    
+    Returns:
+        int: Key value or None if it could not be read
+    """
+    settings = get_settings(schema, key)
+    if settings is not None:
+        return settings.get_int(key)
+    
+    value = run_shell(["gsettings", "get", schema, key], error_msg)
+    if value:
+        value = value.strip("'")
+        if value.isdigit():
+            return int(value)
+    return None
+
+def gsettings_set_value(schema: str, key: str, value, error_msg: str):
+    """
+    Write a bool or int GSettings key in-process, falling back to gsettings.
+    
+    Args:
+        schema (str): Schema id
+        key (str): Key name
+        value (bool|int): New value
+        error_msg (str): Warning shown if the write fails
+    """
+    settings = get_settings(schema, key)
+    if settings is not None:
+        if isinstance(value, bool):
+            ok = settings.set_boolean(key, value)
+        else:
+            ok = settings.set_int(key, value)
+        Gio.Settings.sync()
+        if not ok:
+            print_warning(f"{error_msg}: invalid value {value}")
+        return
+    
+    cli_value = str(value).lower() if isinstance(value, bool) else str(value)
+    run_shell(["gsettings", "set", schema, key, cli_value], error_msg)
+
+def xfconf_call(method: str, params):
+    """
+    Call an org.xfce.Xfconf D-Bus method in-process.
+    
+    Returns:
+        GLib.Variant: Reply, or None if xfconfd is unreachable
+    """
+    try:
+        bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+        return bus.call_sync(
+            "org.xfce.Xfconf", "/org/xfce/Xfconf", "org.xfce.Xfconf",
+            method, params, None, Gio.DBusCallFlags.NONE, -1, None
         )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        print_warning(f"{error_msg}: {e.stderr.strip()}")
+    except GLib.Error:
         return None
 
+def xfconf_get_int(channel: str, prop: str, error_msg: str) -> int:
+    """
+    Read an integer xfconf property over D-Bus, falling back to xfconf-query.
+    
+    Returns:
+        int: Property value or None if it could not be read
+    """
+    if HAS_GIO:
+        reply = xfconf_call("GetProperty", GLib.Variant('(ss)', (channel, prop)))
+        if reply is not None:
+            return int(reply.unpack()[0])
+    
+    value = run_shell(["xfconf-query", "-c", channel, "-p", prop], error_msg)
+    return int(value) if value else None
+
+def xfconf_set_int(channel: str, prop: str, value: int, error_msg: str):
+    """Write an integer xfconf property over D-Bus, falling back to xfconf-query."""
+    if HAS_GIO:
+        params = GLib.Variant('(ssv)', (channel, prop, GLib.Variant('i', value)))
+        if xfconf_call("SetProperty", params) is not None:
+            return
+    
+    run_shell(["xfconf-query", "-c", channel, "-p", prop, "-s", str(value)], error_msg)
+
 def check_dependencies():
     """
     Check for required Python dependencies and inform user.
@@ -95,21 +213,23 @@ def check_dependencies():
     """
     print_header("Dependency Check")
     
+    # Package -> (module probed with find_spec, description)
     required_packages = {
-        'PIL': 'Pillow (image processing)',
-        'PyQt5': 'PyQt5 (graphical interface)',
+        'PIL': ('PIL', 'Pillow (image processing)'),
+        'PyQt5': ('PyQt5.QtWidgets', 'PyQt5 (graphical interface)'),
     }
     
     all_available = True
     
-    for package, description in required_packages.items():
+    for package, (module, description) in required_packages.items():
+        # Locate the module without importing it (loading Qt is slow)
         try:
-            if package == 'PIL':
-                import PIL
-            elif package == 'PyQt5':
-                from PyQt5.QtWidgets import QApplication
-            print_success(f"{package}: {description}")
+            found = importlib.util.find_spec(module) is not None
         except ImportError:
+            found = False  # Parent package missing
+        if found:
+            print_success(f"{package}: {description}")
+        else:
             print_error(f"Missing: {package} - {description}")
             if package == 'PyQt5':
                 print_warning("  → Dashboard will not work without PyQt5")
@@ -119,7 +239,7 @@ def check_dependencies():
             all_available = False
     
     # Simple Conky check
-    conky_available = run_shell("which conky", "Checking Conky") is not None
+    conky_available = shutil.which("conky") is not None
     if not conky_available:
         print_warning("Conky not installed - required for experimental Conky features")
         print_warning("  → Install with: sudo apt install conky-all")
@@ -129,27 +249,27 @@ def check_dependencies():
     else:
         print_success("All dependencies available")
 
+_TIMING_RE = re.compile(r'(\d+)([smh])', re.IGNORECASE)
+_TIMING_UNITS = {'s': 1, 'm': 60, 'h': 3600}
+
+@functools.lru_cache(maxsize=32)
 def parse_timing(timing_str: str) -> int:
     """
     Convert timing string to seconds.
     
+    Cached, so the value parsed while validating a prompt is reused when
+    the accepted answer is converted.
+    
     Args:
         timing_str (str): Timing string (e.g., '30s', '5m', '1h')
         
     Returns:
         int: Seconds or None if invalid
     """
-    units = {'s': 1, 'm': 60, 'h': 3600}
-    
-    if not timing_str:
-        return None
-        
-    try:
-        unit = timing_str[-1].lower()
-        number = int(timing_str[:-1])
-        return number * units.get(unit, 60)
-    except (ValueError, IndexError):
+    match = _TIMING_RE.fullmatch(timing_str or '')
+    if match is None:
         return None
+    return int(match.group(1)) * _TIMING_UNITS[match.group(2).lower()]
 
 def ask(prompt: str, validate=None, default: str = None) -> str:
     """
@@ -186,6 +306,7 @@ def ask(prompt: str, validate=None, default: str = None) -> str:
             
         print_warning("Invalid input, please try again")
 
+@functools.lru_cache(maxsize=1)
 def detect_de() -> str:
     """Detect desktop environment."""
     de = os.environ.get("XDG_CURRENT_DESKTOP", "").lower()
@@ -201,6 +322,7 @@ def detect_de() -> str:
     else:
         return "generic"  # Changed from "unknown" to "generic"
 
+@functools.lru_cache(maxsize=1)
 def detect_session_type() -> str:
     """Detect session type (X11 or Wayland)."""
     if os.environ.get('WAYLAND_DISPLAY'):
@@ -222,39 +344,18 @@ def get_workspaces(de: str) -> tuple:
     """
     try:
         if de == "xfce":
-            count = run_shell(
-                "xfconf-query -c xfwm4 -p /general/workspace_count",
-                "Failed to get XFCE workspace count"
+            count = xfconf_get_int(
+                "xfwm4", "/general/workspace_count", "Failed to get XFCE workspace count"
             )
-            return (int(count), False) if count else (None, None)
+            return (count, False) if count is not None else (None, None)
             
-        elif de == "gnome":
-            count = run_shell(
-                "gsettings get org.gnome.desktop.wm.preferences num-workspaces",
-                "Failed to get GNOME workspace count"
+        elif de in WM_WORKSPACE_SCHEMAS:
+            schema, label = WM_WORKSPACE_SCHEMAS[de]
+            count = gsettings_get_int(
+                schema, "num-workspaces", f"Failed to get {label} workspace count"
             )
-            # Clean up gsettings output
-            if count and count != '':
-                count = count.strip("'")
-                return (int(count), False) if count.isdigit() else (None, None)
-                
-        elif de == "mate":
-            count = run_shell(
-                "gsettings get org.mate.Marco.general num-workspaces",
-                "Failed to get MATE workspace count"
-            )
-            if count and count != '':
-                count = count.strip("'")
-                return (int(count), False) if count.isdigit() else (None, None)
-                
-        elif de == "cinnamon":
-            count = run_shell(
-                "gsettings get org.cinnamon.desktop.wm.preferences num-workspaces",
-                "Failed to get Cinnamon workspace count"
-            )
-            if count and count != '':
-                count = count.strip("'")
-                return (int(count), False) if count.isdigit() else (None, None)
+            if count is not None:
+                return (count, False)
                 
     except (ValueError, TypeError) as e:
         print_warning(f"Could not parse workspace count: {e}")
@@ -272,31 +373,20 @@ def set_fixed_workspaces(de: str, num_ws: int):
     num_ws = int(num_ws)
     
     if de == "gnome":
-        run_shell(
-            "gsettings set org.gnome.shell.extensions.dash-to-dock dynamic-workspaces false",
+        gsettings_set_value(
+            "org.gnome.shell.extensions.dash-to-dock", "dynamic-workspaces", False,
             "Failed to disable GNOME dynamic workspaces"
         )
-        run_shell(
-            f"gsettings set org.gnome.desktop.wm.preferences num-workspaces {num_ws}",
-            "Failed to set GNOME workspace count"
-        )
-        
-    elif de == "mate":
-        run_shell(
-            f"gsettings set org.mate.Marco.general num-workspaces {num_ws}",
-            "Failed to set MATE workspace count"
-        )
         
-    elif de == "cinnamon":
-        run_shell(
-            f"gsettings set org.cinnamon.desktop.wm.preferences num-workspaces {num_ws}",
-            "Failed to set Cinnamon workspace count"
+    if de in WM_WORKSPACE_SCHEMAS:
+        schema, label = WM_WORKSPACE_SCHEMAS[de]
+        gsettings_set_value(
+            schema, "num-workspaces", num_ws, f"Failed to set {label} workspace count"
         )
         
     elif de == "xfce":
-        run_shell(
-            f"xfconf-query -c xfwm4 -p /general/workspace_count -s {num_ws}",
-            "Failed to set XFCE workspace count"
+        xfconf_set_int(
+            "xfwm4", "/general/workspace_count", num_ws, "Failed to set XFCE workspace count"
         )
         
     else:
@@ -315,17 +405,24 @@ def get_icon_color(image_path: str) -> str:
     try:
         with Image.open(image_path) as img:
             rgba_img = img.convert("RGBA")
-            for r, g, b, a in rgba_img.getdata():
-                if a > 0:  # Ignore transparent pixels
-                    return f'#{r:02x}{g:02x}{b:02x}'
-            return ""
+            # The alpha bounding box gives the first row with any opaque
+            # pixel; only that row is scanned for the first opaque column
+            alpha = rgba_img.getchannel("A")
+            bbox = alpha.getbbox()
+            if not bbox:
+                return ""
+            top = bbox[1]
+            row = alpha.crop((bbox[0], top, bbox[2], top + 1)).tobytes()
+            x = bbox[0] + len(row) - len(row.lstrip(b"\x00"))
+            r, g, b, _ = rgba_img.getpixel((x, top))
+            return f'#{r:02x}{g:02x}{b:02x}'
     except Exception as e:
         print_warning(f"Could not detect icon color: {e}")
         return ""
 
 def setup_autostart():
     """Create autostart entry for AWP daemon."""
-    autostart_dir = os.path.expanduser("~/.config/autostart")
+    autostart_dir = AUTOSTART_DIR
     os.makedirs(autostart_dir, exist_ok=True)
     
     desktop_file = os.path.join(autostart_dir, "awp_start.desktop")
@@ -396,100 +493,98 @@ def configure_screen_blanking(config):
         config['general']['blanking_pause'] = 'true'
         print_success("Screen blanking management disabled")
 
-def get_available_themes() -> dict:
-    """Discover available themes on the system and return categorized lists."""
-    themes = {
-        'icon_themes': [],
-        'gtk_themes': [], 
-        'cursor_themes': [],
-        'desktop_themes': [],  # For Cinnamon desktop/panels
-        'wm_themes': []        # For window borders specifically
-    }
+# Theme subdirectories that mark window manager / desktop support
+WM_COMPONENTS = frozenset(('cinnamon', 'metacity-1', 'xfwm4', 'gnome-shell', 'openbox-3'))
+
+def list_dir_entries(path: str, dirs_only: bool = False) -> list:
+    """
+    List entry names in a directory with a single scandir pass.
     
-    # Discover icon themes
+    Args:
+        path (str): Directory to list
+        dirs_only (bool): Only return subdirectories
+        
+    Returns:
+        list: Entry names, or [] if the directory is missing or unreadable
+    """
+    try:
+        with os.scandir(path) as it:
+            if dirs_only:
+                return [e.name for e in it if e.is_dir()]
+            return [e.name for e in it]
+    except OSError:
+        return []  # Skip directories we can't read
+
+@functools.lru_cache(maxsize=1)
+def get_available_themes() -> types.MappingProxyType:
+    """
+    Discover available themes on the system and return categorized lists.
+    
+    Cached, since the installed themes don't change during a setup run.
+    
+    Returns:
+        MappingProxyType: Category -> sorted tuple of theme names (read-only,
+                          as the same object is returned for every workspace)
+    """
+    # Discover icon and cursor themes
     icon_paths = [
         '/usr/share/icons', 
-        os.path.expanduser('/usr/local/share/icons'),
-        os.path.expanduser('~/.icons'),
-        os.path.expanduser('~/.local/share/icons')
+        '/usr/local/share/icons',
+        os.path.join(USER_HOME, '.icons'),
+        os.path.join(USER_HOME, '.local', 'share', 'icons')
     ]
     
+    icon_themes = {}
+    cursor_themes = set()
     for path in icon_paths:
-        if os.path.exists(path):
-            try:
-                items = [d for d in os.listdir(path) 
-                        if os.path.isdir(os.path.join(path, d))]
-                themes['icon_themes'].extend(items)
-            except (PermissionError, OSError):
-                pass  # Skip directories we can't read
+        for theme in list_dir_entries(path, dirs_only=True):
+            icon_themes[theme] = None
+            if os.path.exists(os.path.join(path, theme, 'cursors')):
+                cursor_themes.add(theme)
     
     # Discover ALL themes
     theme_paths = [
         '/usr/share/themes',
         '/usr/local/share/themes', 
-        os.path.expanduser('~/.themes'),
-        os.path.expanduser('~/.local/share/themes')
+        os.path.join(USER_HOME, '.themes'),
+        os.path.join(USER_HOME, '.local', 'share', 'themes')
     ]
     
-    all_themes = []
+    # Theme name -> every base/theme directory it was found in
+    theme_locations = {}
     for path in theme_paths:
-        if os.path.exists(path):
-            try:
-                items = [d for d in os.listdir(path) 
-                        if os.path.isdir(os.path.join(path, d))]
-                all_themes.extend(items)
-            except (PermissionError, OSError):
-                pass  # Skip directories we can't read
-    
-    # Filter for themes that have Cinnamon support (desktop themes)
+        for theme in list_dir_entries(path, dirs_only=True):
+            theme_locations.setdefault(theme, []).append(os.path.join(path, theme))
+    all_themes = sorted(theme_locations)
+    
+    # Filter for themes that have window manager components, and among
+    # those the ones with Cinnamon support (desktop themes)
     desktop_themes = []
     wm_themes = []
     
     for theme in all_themes:
-        # Check all possible theme paths
-        theme_paths_to_check = []
-        for base_path in theme_paths:
-            if os.path.exists(base_path):
-                # Check for various window manager/desktop components
-                possible_paths = [
-                    os.path.join(base_path, theme, 'cinnamon'),
-                    os.path.join(base_path, theme, 'metacity-1'), 
-                    os.path.join(base_path, theme, 'xfwm4'),
-                    os.path.join(base_path, theme, 'gnome-shell'),
-                    os.path.join(base_path, theme, 'openbox-3')
-                ]
-                theme_paths_to_check.extend(possible_paths)
-        
-        # Check if this theme has window manager components
-        has_wm = any(os.path.exists(path) for path in theme_paths_to_check)
-        
-        if has_wm:
+        # One listing per existing theme directory instead of probing
+        # each component in every base path
+        components = set()
+        for location in theme_locations[theme]:
+            components.update(list_dir_entries(location))
+        components &= WM_COMPONENTS
+        
+        if components:
             wm_themes.append(theme)
-            # Themes with Cinnamon specific support are desktop themes
-            if any('cinnamon' in path for path in theme_paths_to_check if os.path.exists(path)):
+            if 'cinnamon' in components:
                 desktop_themes.append(theme)
     
-    # Sort all lists alphabetically
-    themes['gtk_themes'] = sorted(list(set(all_themes)))
-    themes['desktop_themes'] = sorted(list(set(desktop_themes)))
-    themes['wm_themes'] = sorted(list(set(wm_themes)))
-    themes['icon_themes'] = sorted(list(set(themes['icon_themes'])))
-    
-    # Discover cursor themes
-    cursor_themes = []
-    for path in icon_paths:
-        if os.path.exists(path):
-            try:
-                for theme in os.listdir(path):
-                    cursor_path = os.path.join(path, theme, 'cursors')
-                    if os.path.exists(cursor_path):
-                        cursor_themes.append(theme)
-            except (PermissionError, OSError):
-                pass
-    
-    themes['cursor_themes'] = sorted(list(set(cursor_themes)))
-    
-    return themes
+    # Each name list is sorted once; the filtered lists inherit its order.
+    # The result is shared by every caller, so hand out a read-only view
+    icon_themes = tuple(sorted(icon_themes))
+    return types.MappingProxyType({
+        'icon_themes': icon_themes,
+        'gtk_themes': tuple(all_themes),
+        'cursor_themes': tuple(t for t in icon_themes if t in cursor_themes),
+        'desktop_themes': tuple(desktop_themes),  # For Cinnamon desktop/panels
+        'wm_themes': tuple(wm_themes)             # For window borders specifically
+    })
 
 def show_numbered_menu(items: list, title: str, page_size: int = 20) -> str:
     """Display a paginated numbered menu for theme selection."""
@@ -500,18 +595,17 @@ def show_numbered_menu(items: list, title: str, page_size: int = 20) -> str:
     # Ensure items are sorted (double-check)
     sorted_items = sorted(items)
     
-    print(f"\n{title}:")
-    print("-" * 40)
-    print(f"Found {len(sorted_items)} themes")
-    print("-" * 40)
+    rule = "-" * 40
+    print(f"\n{title}:\n{rule}\nFound {len(sorted_items)} themes\n{rule}")
     
     # Paginate if too many items
     for page_start in range(0, len(sorted_items), page_size):
         page_end = min(page_start + page_size, len(sorted_items))
         page_items = sorted_items[page_start:page_end]
         
-        for i, item in enumerate(page_items, 1):
-            print(f"  {page_start + i:2d}. {item}")
+        # One write per page rather than one per item
+        print("\n".join(f"  {page_start + i:2d}. {item}"
+                        for i, item in enumerate(page_items, 1)))
         
         if page_end < len(sorted_items):
             cont = ask(f"\nShow more? {page_end}/{len(sorted_items)} shown (y/n): ", 
@@ -690,9 +784,17 @@ def main():
     # DIRECTORY SETUP
     # -------------------------------------------------------------------------
     print_header("Directory Setup")
-    if os.path.exists(ICON_DIR):
-        shutil.rmtree(ICON_DIR)
-    os.makedirs(ICON_DIR)
+    # Empty an existing icon directory in place (one listing, one unlink
+    # per old icon) instead of removing and recreating the whole tree
+    try:
+        with os.scandir(ICON_DIR) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+    except FileNotFoundError:
+        os.makedirs(ICON_DIR)
     print_success(f"Icon directory created: {ICON_DIR}")
     
     # -------------------------------------------------------------------------
@@ -733,6 +835,8 @@ def main():
     # INDIVIDUAL WORKSPACE SETUP
     # -------------------------------------------------------------------------
     used_folders = set()
+    # List BASE_FOLDER once instead of stat-ing every folder name typed
+    base_dirs = set(list_dir_entries(BASE_FOLDER, dirs_only=True))
     
     for i in range(1, n_ws + 1):
         print_header(f"Workspace {i} Configuration")
@@ -748,11 +852,20 @@ def main():
             )
             full_path = os.path.join(BASE_FOLDER, folder_name)
             
-            if not os.path.isdir(full_path):
+            if folder_name in base_dirs:
+                folder_exists = True
+            elif os.sep in folder_name or folder_name in (os.curdir, os.pardir):
+                # Not a direct child of BASE_FOLDER, so not in the listing
+                folder_exists = os.path.isdir(full_path)
+            else:
+                folder_exists = False
+            
+            if not folder_exists:
                 print_warning(f"Folder does not exist: {full_path}")
                 create = ask("Create this folder? [Y/n]: ", default='y')
                 if create.lower() == 'y':
                     os.makedirs(full_path)
+                    base_dirs.add(folder_name)
                     print_success(f"Created folder: {full_path}")
                 else:
                     continue
@@ -781,7 +894,7 @@ def main():
         folder_base = os.path.basename(folder_name)
         _, ext = os.path.splitext(icon_path)
         dest_icon = os.path.join(ICON_DIR, f"{folder_base}{ext or '.png'}")
-        shutil.copy(icon_path, dest_icon)
+        shutil.copyfile(icon_path, dest_icon)
         config[section]['icon'] = dest_icon
         print_success(f"Icon configured: {dest_icon}")
         
@@ -853,8 +966,11 @@ def main():
     # -------------------------------------------------------------------------
     print_header("Saving Configuration")
     
+    # Render in memory so the file gets one write instead of one per line
+    buf = io.StringIO()
+    config.write(buf)
     with open(CONFIG_PATH, 'w') as f:
-        config.write(f)
+        f.write(buf.getvalue())
     
     print_success(f"Configuration saved: {CONFIG_PATH}")
     
@@ -866,7 +982,7 @@ def main():
     print_success("AWP configuration file created successfully!")
     
     # Autostart status
-    autostart_file = os.path.expanduser("~/.config/autostart/awp_start.desktop")
+    autostart_file = os.path.join(AUTOSTART_DIR, "awp_start.desktop")
     if os.path.exists(autostart_file):
         print_success("AWP will start automatically on next login")
     else: